@@ -4,76 +4,168 @@ from __future__ import annotations
 
 import argparse
 import sys
+from functools import cache
+from typing import Any
 
 from menu_kit import __version__
-from menu_kit.core.runner import Runner, RunnerOptions
 
+# Argument specs: (flags, keyword arguments for add_argument)
+_ARG_SPECS: tuple[tuple[tuple[str, ...], dict[str, Any]], ...] = (
+    (
+        ("-p", "--plugin"),
+        {
+            "metavar": "NAME",
+            "help": "Jump directly to a plugin (e.g., -p network or -p files:recent)",
+        },
+    ),
+    (
+        ("-b", "--backend"),
+        {"metavar": "NAME", "help": "Override menu backend (rofi, fuzzel, dmenu, fzf)"},
+    ),
+    (
+        ("--backend-args",),
+        {"metavar": "ARGS", "help": "Additional arguments to pass to the menu backend"},
+    ),
+    (
+        ("-t", "--terminal"),
+        {"action": "store_true", "help": "Use fzf for terminal-based selection"},
+    ),
+    (
+        ("--print",),
+        {
+            "dest": "print_items",
+            "action": "store_true",
+            "help": "Print items to stdout instead of showing menu",
+        },
+    ),
+    (
+        ("--dry-run",),
+        {"action": "store_true", "help": "Show what would be executed without running it"},
+    ),
+    (
+        ("--rebuild",),
+        {"action": "store_true", "help": "Rebuild the cache"},
+    ),
+    (
+        ("selections",),
+        {
+            "nargs": "*",
+            "metavar": "SELECTION",
+            "help": "Chained selections for scripting (e.g., menu-kit -- 'Files' 'Documents')",
+        },
+    ),
+)
 
-def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
-    """Parse command-line arguments."""
+_VERSION_FLAGS = ("-V", "--version")
+
+
+def _option_table() -> tuple[dict[str, tuple[str, bool]], dict[str, Any]]:
+    """Map each option flag to (dest, takes_value) and collect the defaults."""
+    flags_table: dict[str, tuple[str, bool]] = {}
+    defaults: dict[str, Any] = {}
+    for flags, kwargs in _ARG_SPECS:
+        if not flags[0].startswith("-"):
+            defaults[flags[0]] = []
+            continue
+        dest = kwargs.get("dest") or flags[-1].lstrip("-").replace("-", "_")
+        takes_value = kwargs.get("action") != "store_true"
+        defaults[dest] = None if takes_value else False
+        for flag in flags:
+            flags_table[flag] = (dest, takes_value)
+    return flags_table, defaults
+
+
+_OPTIONS, _DEFAULTS = _option_table()
+
+
+@cache
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser (once per process)."""
     parser = argparse.ArgumentParser(
         prog="menu-kit",
         description="A modular, menu-agnostic launcher for Linux",
     )
     parser.add_argument(
-        "-V",
-        "--version",
+        *_VERSION_FLAGS,
         action="version",
         version=f"%(prog)s {__version__}",
     )
-    parser.add_argument(
-        "-p",
-        "--plugin",
-        metavar="NAME",
-        help="Jump directly to a plugin (e.g., -p network or -p files:recent)",
-    )
-    parser.add_argument(
-        "-b",
-        "--backend",
-        metavar="NAME",
-        help="Override menu backend (rofi, fuzzel, dmenu, fzf)",
-    )
-    parser.add_argument(
-        "--backend-args",
-        metavar="ARGS",
-        help="Additional arguments to pass to the menu backend",
-    )
-    parser.add_argument(
-        "-t",
-        "--terminal",
-        action="store_true",
-        help="Use fzf for terminal-based selection",
-    )
-    parser.add_argument(
-        "--print",
-        dest="print_items",
-        action="store_true",
-        help="Print items to stdout instead of showing menu",
-    )
-    parser.add_argument(
-        "--dry-run",
-        action="store_true",
-        help="Show what would be executed without running it",
-    )
-    parser.add_argument(
-        "--rebuild",
-        action="store_true",
-        help="Rebuild the cache",
-    )
-    parser.add_argument(
-        "selections",
-        nargs="*",
-        metavar="SELECTION",
-        help="Chained selections for scripting (e.g., menu-kit -- 'Files' 'Documents')",
-    )
+    for flags, kwargs in _ARG_SPECS:
+        parser.add_argument(*flags, **kwargs)
+    return parser
+
+
+def _fast_parse(argv: list[str]) -> argparse.Namespace | None:
+    """Parse the common invocations without building the argparse parser.
+
+    Handles the exact flags above, ``--flag=value``, and selections after
+    ``--``. Returns None for anything else (help, abbreviations, bundled
+    short flags, bare positionals, errors) so argparse can deal with it.
+    """
+    values = dict(_DEFAULTS)
+    # A shallow copy would share the default list; argparse gives a fresh one
+    values["selections"] = []
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg == "--":
+            selections = argv[i + 1 :]
+            if "--" in selections:
+                return None
+            values["selections"] = selections
+            break
+
+        flag, eq, inline_value = arg.partition("=")
+        spec = _OPTIONS.get(flag)
+        if spec is None:
+            return None
+        dest, takes_value = spec
 
-    return parser.parse_args(argv)
+        if not takes_value:
+            if eq:
+                return None
+            values[dest] = True
+        elif eq:
+            if not flag.startswith("--"):
+                return None
+            values[dest] = inline_value
+        else:
+            i += 1
+            if i == len(argv) or argv[i].startswith("-"):
+                return None
+            values[dest] = argv[i]
+        i += 1
+
+    return argparse.Namespace(**values)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse command-line arguments."""
+    if argv is None:
+        argv = sys.argv[1:]
+
+    # Answer --version without building the parser
+    for arg in argv:
+        if arg == "--":
+            break
+        if arg in _VERSION_FLAGS:
+            print(f"menu-kit {__version__}")
+            raise SystemExit(0)
+
+    fast = _fast_parse(argv)
+    if fast is not None:
+        return fast
+
+    return _build_parser().parse_args(argv)
 
 
 def main(argv: list[str] | None = None) -> int:
     """Main entry point."""
     args = parse_args(argv)
 
+    # Deferred so --help and --version never pay for the runner's imports
+    from menu_kit.core.runner import Runner, RunnerOptions
+
     options = RunnerOptions(
         backend=args.backend,
         backend_args=args.backend_args,
@@ -2,38 +2,120 @@
 
 from __future__ import annotations
 
-import tomllib
+import contextlib
+import json
+import os
 from dataclasses import dataclass, field
+from functools import cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Final
 
 
+def _xdg_dir(env_var: str, default: Path) -> Path:
+    """Resolve an XDG base directory, ignoring unset or relative values."""
+    value = os.environ.get(env_var)
+    if value and os.path.isabs(value):
+        return Path(value)
+    return default
+
+
+_DEFAULT_REPOS: Final[tuple[str, ...]] = ("markhedleyjones/menu-kit-plugins",)
+_DEFAULT_SUBMENU_PREFIX: Final[str] = "→ "
+_DEFAULT_SEPARATOR: Final[str] = "─" * 40
+
+
+@cache
 def get_config_dir() -> Path:
     """Get the configuration directory, respecting XDG."""
-    xdg_config = Path.home() / ".config"
+    xdg_config = _xdg_dir("XDG_CONFIG_HOME", Path.home() / ".config")
     return xdg_config / "menu-kit"
 
 
+@cache
 def get_cache_dir() -> Path:
     """Get the cache directory, respecting XDG."""
-    xdg_cache = Path.home() / ".cache"
+    xdg_cache = _xdg_dir("XDG_CACHE_HOME", Path.home() / ".cache")
     return xdg_cache / "menu-kit"
 
 
+@cache
 def get_data_dir() -> Path:
     """Get the data directory, respecting XDG."""
-    xdg_data = Path.home() / ".local" / "share"
+    xdg_data = _xdg_dir("XDG_DATA_HOME", Path.home() / ".local" / "share")
     return xdg_data / "menu-kit"
 
 
-@dataclass
+def write_atomic(path: Path, data: bytes) -> bool:
+    """Write a file via a uniquely named temp file and a rename. Failures are ignored.
+
+    Readers never see a partial file, and concurrent writers (threads or
+    processes) never share a temp file. Returns True if the file was written.
+    """
+    # Only paid when something is written, not on every startup
+    import tempfile
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    except OSError:
+        return False
+
+    try:
+        with os.fdopen(fd, "wb") as tmp:
+            tmp.write(data)
+        os.replace(tmp_name, path)
+    except OSError:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_name)
+        return False
+    return True
+
+
+def _read_config_data(path: Path, st: os.stat_result) -> dict[str, Any]:
+    """Read TOML config data, reusing a JSON copy from the cache dir when fresh.
+
+    The cached copy is stamped with the source path, mtime and size (taken from
+    the caller's stat result), so any edit to the TOML file invalidates it.
+    """
+    stamp = [str(path), st.st_mtime_ns, st.st_size]
+    cache_path = get_cache_dir() / "config.json"
+
+    try:
+        cached = json.loads(cache_path.read_bytes())
+        if cached["stamp"] == stamp:
+            data: dict[str, Any] = cached["data"]
+            return data
+    except (OSError, ValueError, KeyError, TypeError):
+        pass  # Missing or unreadable cache - fall back to parsing
+
+    # Only paid when the cache is stale
+    import tomllib
+
+    # One unbuffered read; the file is small and parsed in full
+    data = tomllib.loads(path.read_bytes().decode("utf-8"))
+
+    _write_config_cache(cache_path, stamp, data)
+    return data
+
+
+def _write_config_cache(cache_path: Path, stamp: list[Any], data: dict[str, Any]) -> None:
+    """Write the JSON config cache atomically. Failures are ignored."""
+    try:
+        payload = json.dumps({"stamp": stamp, "data": data})
+    except (TypeError, ValueError):
+        return  # e.g. TOML datetimes - just parse the TOML next time
+
+    write_atomic(cache_path, payload.encode())
+
+
+@dataclass(slots=True)
 class MenuBackendConfig:
     """Configuration for a menu backend."""
 
-    args: list[str] = field(default_factory=list)
+    args: tuple[str, ...] = ()
 
 
-@dataclass
+@dataclass(slots=True)
 class MenuConfig:
     """Configuration for the menu system."""
 
@@ -44,14 +126,14 @@ class MenuConfig:
     fzf: MenuBackendConfig = field(default_factory=MenuBackendConfig)
 
 
-@dataclass
+@dataclass(slots=True)
 class DisplayConfig:
     """Configuration for display formatting."""
 
-    submenu_prefix: str = "→ "
+    submenu_prefix: str = _DEFAULT_SUBMENU_PREFIX
     info_prefix: str = ""
     header_prefix: str = ""
-    separator: str = "─" * 40
+    separator: str = _DEFAULT_SEPARATOR
     show_info_items: bool = True
     show_headers: bool = True
     show_separators: bool = True
@@ -59,17 +141,17 @@ class DisplayConfig:
     submenus_first: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class PluginsConfig:
     """Configuration for the plugin system."""
 
-    repositories: list[str] = field(default_factory=lambda: ["markhedleyjones/menu-kit-plugins"])
+    repositories: tuple[str, ...] = _DEFAULT_REPOS
     allow_unverified: bool = False
     default_display_mode: str = "auto"  # "inline", "submenu", "auto"
     item_threshold: int = 20  # For auto mode: >threshold items → submenu
 
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     """Main configuration for menu-kit."""
 
@@ -85,13 +167,15 @@ class Config:
         if path is None:
             path = get_config_dir() / "config.toml"
 
-        if not path.exists():
+        # A single stat both checks existence and stamps the cache
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
             config = cls()
             config._source_path = path
             return config
 
-        with path.open("rb") as f:
-            data = tomllib.load(f)
+        data = _read_config_data(path, st)
 
         config = cls.from_dict(data)
         config._source_path = path
@@ -103,18 +187,18 @@ class Config:
         menu_data = data.get("menu", {})
         menu = MenuConfig(
             backend=menu_data.get("backend", ""),
-            rofi=MenuBackendConfig(args=menu_data.get("rofi", {}).get("args", [])),
-            fuzzel=MenuBackendConfig(args=menu_data.get("fuzzel", {}).get("args", [])),
-            dmenu=MenuBackendConfig(args=menu_data.get("dmenu", {}).get("args", [])),
-            fzf=MenuBackendConfig(args=menu_data.get("fzf", {}).get("args", [])),
+            rofi=MenuBackendConfig(args=tuple(menu_data.get("rofi", {}).get("args", ()))),
+            fuzzel=MenuBackendConfig(args=tuple(menu_data.get("fuzzel", {}).get("args", ()))),
+            dmenu=MenuBackendConfig(args=tuple(menu_data.get("dmenu", {}).get("args", ()))),
+            fzf=MenuBackendConfig(args=tuple(menu_data.get("fzf", {}).get("args", ()))),
         )
 
         display_data = data.get("display", {})
         display = DisplayConfig(
-            submenu_prefix=display_data.get("submenu_prefix", "→ "),
+            submenu_prefix=display_data.get("submenu_prefix", _DEFAULT_SUBMENU_PREFIX),
             info_prefix=display_data.get("info_prefix", ""),
             header_prefix=display_data.get("header_prefix", ""),
-            separator=display_data.get("separator", "─" * 40),
+            separator=display_data.get("separator", _DEFAULT_SEPARATOR),
             show_info_items=display_data.get("show_info_items", True),
             show_headers=display_data.get("show_headers", True),
             show_separators=display_data.get("show_separators", True),
@@ -124,7 +208,7 @@ class Config:
 
         plugins_data = data.get("plugins", {})
         plugins = PluginsConfig(
-            repositories=plugins_data.get("repositories", ["markhedleyjones/menu-kit-plugins"]),
+            repositories=tuple(plugins_data.get("repositories", _DEFAULT_REPOS)),
             allow_unverified=plugins_data.get("allow_unverified", False),
             default_display_mode=plugins_data.get("default_display_mode", "auto"),
             item_threshold=plugins_data.get("item_threshold", 20),
@@ -143,7 +227,7 @@ class Config:
         if backend_config is None:
             return []
         if isinstance(backend_config, MenuBackendConfig):
-            return backend_config.args
+            return list(backend_config.args)
         return []
 
     def save(self, path: Path | None = None) -> None:
@@ -177,7 +261,7 @@ class Config:
 
         # Display section (only non-defaults)
         display_lines = []
-        if self.display.submenu_prefix != "→ ":
+        if self.display.submenu_prefix != _DEFAULT_SUBMENU_PREFIX:
             display_lines.append(f'submenu_prefix = "{self.display.submenu_prefix}"')
         if not self.display.show_info_items:
             display_lines.append("show_info_items = false")
@@ -2,15 +2,16 @@
 
 from __future__ import annotations
 
+import itertools
 import json
 import sqlite3
 from collections.abc import Iterator
 from contextlib import contextmanager
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar
 
 from menu_kit.core.config import get_cache_dir
 
@@ -25,9 +26,12 @@ class ItemType(Enum):
     HEADER = "header"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MenuItem:
-    """A menu item stored in the database."""
+    """A menu item stored in the database.
+
+    Items are immutable; use ``dataclasses.replace`` to derive a modified copy.
+    """
 
     id: str
     title: str
@@ -37,11 +41,18 @@ class MenuItem:
     metadata: dict[str, Any] | None = None
     icon: str | None = None
     badge: str | None = None
+    # Action passed to the plugin's run(): the ID part after the first ":".
+    # Derived from the ID, never passed in, so copies and database reads agree
+    action: str = field(init=False)
 
     # Frequency data (populated when querying)
     use_count: int = 0
     last_used: datetime | None = None
 
+    def __post_init__(self) -> None:
+        # Parse once here rather than on every selection
+        object.__setattr__(self, "action", self.id.partition(":")[2])
+
 
 SCHEMA = """
 CREATE TABLE IF NOT EXISTS items (
@@ -77,21 +88,44 @@ CREATE TABLE IF NOT EXISTS cache_meta (
 );
 """
 
+INSERT_ITEM_SQL = """
+INSERT OR REPLACE INTO items
+(id, title, item_type, path, plugin, metadata, icon, badge)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
 
 class Database:
     """SQLite database manager for menu-kit."""
 
-    def __init__(self, path: Path | None = None) -> None:
-        """Initialise the database."""
+    # Numbers the shared-cache names handed out by in_memory()
+    _memory_ids: ClassVar[itertools.count[int]] = itertools.count()
+
+    def __init__(self, path: Path | str | None = None, *, uri: bool = False) -> None:
+        """Initialise the database.
+
+        With uri=True, path is an SQLite URI. A connection is held open for
+        the lifetime of the object so that shared-cache memory databases
+        survive between the per-operation connections.
+        """
         if path is None:
             cache_dir = get_cache_dir()
             cache_dir.mkdir(parents=True, exist_ok=True)
             path = cache_dir / "index.db"
 
         self.path = path
+        self._uri = uri
         self._connection: sqlite3.Connection | None = None
+        if uri:
+            self._connection = sqlite3.connect(path, uri=True)
         self._init_db()
 
+    @classmethod
+    def in_memory(cls) -> Database:
+        """Create a private in-memory database, mainly for tests."""
+        name = f"menu-kit-{next(cls._memory_ids)}"
+        return cls(f"file:{name}?mode=memory&cache=shared", uri=True)
+
     def _init_db(self) -> None:
         """Initialise the database schema."""
         with self._connect() as conn:
@@ -100,7 +134,7 @@ class Database:
     @contextmanager
     def _connect(self) -> Iterator[sqlite3.Connection]:
         """Get a database connection."""
-        conn = sqlite3.connect(self.path)
+        conn = sqlite3.connect(self.path, uri=self._uri)
         conn.row_factory = sqlite3.Row
         try:
             yield conn
@@ -111,47 +145,18 @@ class Database:
     def add_item(self, item: MenuItem) -> None:
         """Add or update an item in the database."""
         with self._connect() as conn:
-            conn.execute(
-                """
-                INSERT OR REPLACE INTO items
-                (id, title, item_type, path, plugin, metadata, icon, badge)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    item.id,
-                    item.title,
-                    item.item_type.value,
-                    item.path,
-                    item.plugin,
-                    json.dumps(item.metadata) if item.metadata else None,
-                    item.icon,
-                    item.badge,
-                ),
-            )
+            conn.execute(INSERT_ITEM_SQL, self._item_to_row(item))
 
     def add_items(self, items: list[MenuItem]) -> None:
         """Add or update multiple items in the database."""
         with self._connect() as conn:
-            conn.executemany(
-                """
-                INSERT OR REPLACE INTO items
-                (id, title, item_type, path, plugin, metadata, icon, badge)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                [
-                    (
-                        item.id,
-                        item.title,
-                        item.item_type.value,
-                        item.path,
-                        item.plugin,
-                        json.dumps(item.metadata) if item.metadata else None,
-                        item.icon,
-                        item.badge,
-                    )
-                    for item in items
-                ],
-            )
+            conn.executemany(INSERT_ITEM_SQL, [self._item_to_row(item) for item in items])
+
+    def replace_items(self, items: list[MenuItem]) -> None:
+        """Replace all items in a single transaction."""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM items")
+            conn.executemany(INSERT_ITEM_SQL, [self._item_to_row(item) for item in items])
 
     def get_item(self, item_id: str) -> MenuItem | None:
         """Get a single item by ID."""
@@ -307,6 +312,19 @@ class Database:
                     (plugin, key),
                 )
 
+    def _item_to_row(self, item: MenuItem) -> tuple[Any, ...]:
+        """Convert a MenuItem to a row for INSERT_ITEM_SQL."""
+        return (
+            item.id,
+            item.title,
+            item.item_type.value,
+            item.path,
+            item.plugin,
+            json.dumps(item.metadata) if item.metadata else None,
+            item.icon,
+            item.badge,
+        )
+
     def _row_to_item(self, row: sqlite3.Row) -> MenuItem:
         """Convert a database row to a MenuItem."""
         metadata = json.loads(row["metadata"]) if row["metadata"] else None
@@ -6,6 +6,8 @@ from enum import Enum
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from menu_kit.core.config import Config
     from menu_kit.core.database import Database
 
@@ -43,6 +45,25 @@ class DisplayModeManager:
         # Apply default logic
         return self._get_default_mode(plugin_name)
 
+    def get_modes(self, plugin_names: Iterable[str]) -> dict[str, DisplayMode]:
+        """Get display modes for several plugins, sharing one item count query."""
+        if self._cache is None:
+            self._load_cache()
+
+        assert self._cache is not None
+
+        modes: dict[str, DisplayMode] = {}
+        counts: dict[str, int] | None = None
+        for name in plugin_names:
+            if name in self._cache:
+                modes[name] = self._cache[name]
+                continue
+            if counts is None:
+                counts = self.database.get_item_counts_by_plugin()
+            modes[name] = self._get_default_mode(name, counts)
+
+        return modes
+
     def set_mode(self, plugin_name: str, mode: DisplayMode) -> None:
         """Set display mode for a plugin."""
         modes = self.database.get_plugin_data(CORE_PLUGIN_NAME, DISPLAY_MODES_KEY) or {}
@@ -55,7 +76,9 @@ class DisplayModeManager:
         stored = self.database.get_plugin_data(CORE_PLUGIN_NAME, DISPLAY_MODES_KEY) or {}
         self._cache = {name: DisplayMode(value) for name, value in stored.items()}
 
-    def _get_default_mode(self, plugin_name: str) -> DisplayMode:
+    def _get_default_mode(
+        self, plugin_name: str, counts: dict[str, int] | None = None
+    ) -> DisplayMode:
         """Calculate default mode based on config and item count."""
         default = self.config.plugins.default_display_mode
 
@@ -65,7 +88,8 @@ class DisplayModeManager:
             return DisplayMode.SUBMENU
 
         # Auto mode: check item count
-        counts = self.database.get_item_counts_by_plugin()
+        if counts is None:
+            counts = self.database.get_item_counts_by_plugin()
         count = counts.get(plugin_name, 0)
         threshold = self.config.plugins.item_threshold
 
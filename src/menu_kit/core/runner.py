@@ -3,17 +3,17 @@
 from __future__ import annotations
 
 import sys
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import TYPE_CHECKING
 
-from menu_kit.core.config import Config
-from menu_kit.core.database import Database, ItemType, MenuItem
+from menu_kit.core.database import ItemType, MenuItem
 from menu_kit.core.display_mode import DisplayMode, DisplayModeManager
-from menu_kit.menu.base import GUI_BACKENDS, get_backend
-from menu_kit.plugins.loader import PluginLoader
 
 if TYPE_CHECKING:
+    from menu_kit.core.config import Config
+    from menu_kit.core.database import Database
     from menu_kit.menu.base import MenuBackend
+    from menu_kit.plugins.loader import PluginLoader
 
 
 # Exit codes
@@ -25,8 +25,11 @@ EXIT_EXECUTION_FAILED = 4
 EXIT_CONFIG_ERROR = 5
 EXIT_NO_BACKEND = 6
 
+# Bound once for the per-item checks in _format_item (enum members are singletons)
+_SUBMENU = ItemType.SUBMENU
 
-@dataclass
+
+@dataclass(slots=True)
 class RunnerOptions:
     """Options for the runner."""
 
@@ -43,15 +46,25 @@ class RunnerOptions:
 class Runner:
     """Main orchestration class for menu-kit."""
 
+    __slots__ = ("options", "config", "database", "backend", "loader", "_items_cache")
+
     def __init__(self, options: RunnerOptions | None = None) -> None:
         self.options = options or RunnerOptions()
         self.config: Config | None = None
         self.database: Database | None = None
         self.backend: MenuBackend | None = None
         self.loader: PluginLoader | None = None
+        # Database items for the main menu, reused until something changes them
+        self._items_cache: list[MenuItem] | None = None
 
     def setup(self) -> int:
         """Initialize all components. Returns exit code."""
+        # Imported here to keep the import of this module cheap
+        from menu_kit.core.config import Config
+        from menu_kit.core.database import Database
+        from menu_kit.menu.base import GUI_BACKENDS, get_backend
+        from menu_kit.plugins.loader import PluginLoader
+
         # Load config
         self.config = Config.load()
 
@@ -140,11 +153,7 @@ class Runner:
         assert self.loader is not None
 
         # Parse plugin:action format
-        if ":" in plugin_spec:
-            plugin_name, action = plugin_spec.split(":", 1)
-        else:
-            plugin_name = plugin_spec
-            action = ""
+        plugin_name, _, action = plugin_spec.partition(":")
 
         if self.options.dry_run:
             print(f"Would run plugin: {plugin_name}")
@@ -180,11 +189,7 @@ class Runner:
 
             # Execute the item
             if item.plugin:
-                # Parse action from item ID if present
-                action = ""
-                if ":" in item.id:
-                    _, action = item.id.split(":", 1)
-                self.loader.run_plugin(item.plugin, action)
+                self.loader.run_plugin(item.plugin, item.action)
 
         return EXIT_SUCCESS
 
@@ -197,9 +202,10 @@ class Runner:
         items = self._build_main_menu(display_manager)
         prefix = self.config.display.submenu_prefix
 
-        for item in items:
-            display = self._format_item(item, prefix)
-            print(display)
+        # One write for the whole listing rather than a print() per item
+        lines = [self._format_item(item, prefix) for item in items]
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
 
         return EXIT_SUCCESS
 
@@ -242,13 +248,11 @@ class Runner:
             # Record usage
             if self.config.frequency_tracking:
                 self.database.record_use(item.id)
+                self._items_cache = None
 
             # Execute plugin and exit (launcher behavior)
             if item.plugin:
-                action = ""
-                if ":" in item.id:
-                    _, action = item.id.split(":", 1)
-                self.loader.run_plugin(item.plugin, action)
+                self.loader.run_plugin(item.plugin, item.action)
                 return EXIT_SUCCESS
 
     def _build_main_menu(self, display_manager: DisplayModeManager) -> list[MenuItem]:
@@ -260,8 +264,10 @@ class Runner:
         sort = self.config.display.sort
         order_by_freq = sort == "frequency"
 
-        # Get cached items from database
-        all_items = self.database.get_items(order_by_frequency=order_by_freq)
+        # Get cached items from database (queried once per change, not per loop)
+        if self._items_cache is None:
+            self._items_cache = self.database.get_items(order_by_frequency=order_by_freq)
+        all_items = list(self._items_cache)
 
         # Add dynamic items from non-cacheable plugins (computed fresh each time)
         dynamic_items = self.loader.index_dynamic()
@@ -283,19 +289,10 @@ class Runner:
             mode = display_manager.get_mode(item.plugin)
 
             if mode == DisplayMode.INLINE:
-                # Create new item with prefixed title (don't mutate original)
+                # Copy with a prefixed title; items are frozen
                 result.append(
-                    MenuItem(
-                        id=item.id,
-                        title=display_manager.format_inline_title(item.plugin, item.title),
-                        item_type=item.item_type,
-                        path=item.path,
-                        plugin=item.plugin,
-                        metadata=item.metadata,
-                        icon=item.icon,
-                        badge=item.badge,
-                        use_count=item.use_count,
-                        last_used=item.last_used,
+                    replace(
+                        item, title=display_manager.format_inline_title(item.plugin, item.title)
                     )
                 )
             else:
@@ -384,24 +381,20 @@ class Runner:
             # Record usage
             if self.config.frequency_tracking:
                 self.database.record_use(item.id)
+                self._items_cache = None
 
             # Execute and exit
             if item.plugin:
-                action = ""
-                if ":" in item.id:
-                    _, action = item.id.split(":", 1)
-                self.loader.run_plugin(item.plugin, action)
+                self.loader.run_plugin(item.plugin, item.action)
                 return True  # Signal to exit menu
 
             return False
 
     def _format_item(self, item: MenuItem, prefix: str) -> str:
         """Format an item for display."""
-        display = item.title
-        if item.item_type == ItemType.SUBMENU:
-            display = f"{prefix}{display}"
+        display = f"{prefix}{item.title}" if item.item_type is _SUBMENU else item.title
         if item.badge:
-            display = f"{display}  ({item.badge})"
+            return f"{display}  ({item.badge})"
         return display
 
     def teardown(self) -> None:
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import sys
 from abc import ABC, abstractmethod
+from collections.abc import Mapping
 from dataclasses import dataclass, field
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any
 
 from menu_kit.core.database import ItemType, MenuItem
@@ -34,6 +37,11 @@ class PluginContext:
     config: Config
     database: Database
     menu_backend: MenuBackend
+    # When set, notify() records messages here instead of delivering them
+    notifications: list[str] | None = field(default=None, repr=False, compare=False)
+    _installed_cache: Mapping[str, PluginInfo] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def menu(
         self,
@@ -79,8 +87,13 @@ class PluginContext:
         """Show a notification to the user.
 
         Uses notify-send for desktop notifications on Linux.
-        Falls back to printing if notify-send is unavailable.
+        Falls back to stdout if notify-send is unavailable. If the context
+        has a notifications list, the message is appended there instead.
         """
+        if self.notifications is not None:
+            self.notifications.append(message)
+            return
+
         import shutil
         import subprocess
 
@@ -95,7 +108,7 @@ class PluginContext:
             except OSError:
                 pass
         # Fallback to console
-        print(f"[{title}] {message}")
+        sys.stdout.write(f"[{title}] {message}\n")
 
     def show_result(self, message: str, prompt: str = "Result") -> None:
         """Show an action result in a menu.
@@ -137,12 +150,24 @@ class PluginContext:
         """Register items to appear in the main menu."""
         self.database.add_items(items)
 
-    def get_installed_plugins(self) -> dict[str, PluginInfo]:
-        """Get all installed plugins with their info."""
-        loader: PluginLoader | None = getattr(self, "_loader", None)
-        if loader is None:
-            return {}
-        return {name: plugin.info for name, plugin in loader.get_all_plugins().items()}
+    def get_installed_plugins(self) -> Mapping[str, PluginInfo]:
+        """Get all installed plugins with their info, ordered by name.
+
+        The result is a cached read-only mapping; call invalidate_plugins()
+        when plugins change.
+        """
+        if self._installed_cache is None:
+            loader: PluginLoader | None = getattr(self, "_loader", None)
+            if loader is None:
+                return MappingProxyType({})
+            self._installed_cache = MappingProxyType(
+                {name: plugin.info for name, plugin in sorted(loader.get_all_plugins().items())}
+            )
+        return self._installed_cache
+
+    def invalidate_plugins(self) -> None:
+        """Drop the cached installed plugins, e.g. after an install."""
+        self._installed_cache = None
 
     def unregister_plugin(self, name: str) -> bool:
         """Unregister a plugin from the loader.
@@ -156,6 +181,7 @@ class PluginContext:
         loader: PluginLoader | None = getattr(self, "_loader", None)
         if loader is None:
             return False
+        self.invalidate_plugins()
         return loader.unregister_plugin(name)
 
 
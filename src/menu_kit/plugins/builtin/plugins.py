@@ -2,20 +2,117 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
+import os
 import shutil
+import stat
+import tempfile
+import threading
+import time
+import urllib.error
 import urllib.request
-from typing import Any
-
-from menu_kit.core.config import get_data_dir
+import zipfile
+from collections.abc import Callable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, ClassVar, Final
+
+from menu_kit.core.config import get_cache_dir, get_data_dir, write_atomic
 from menu_kit.core.database import ItemType, MenuItem
 from menu_kit.core.display_mode import DisplayMode, DisplayModeManager
 from menu_kit.plugins.base import Plugin, PluginContext, PluginInfo
 
+# orjson parses bytes directly and is much faster on large indexes; it's an
+# optional extra, so fall back to the stdlib parser
+try:
+    import orjson
+except ImportError:
+    _HAS_ORJSON = False
+else:
+    _HAS_ORJSON = True
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON from bytes, using orjson when it's installed."""
+    if _HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# ID prefixes shared by the menus that build items and the loops that parse
+# selections back out of them
+_INFO_PREFIX: Final = "plugins:info:"
+_REPO_PREFIX: Final = "plugins:repo:"
+_AVAILABLE_PREFIX: Final = "plugins:available:"
+
+
+@dataclass(slots=True)
+class PluginIndexEntry:
+    """A plugin listed in a repository's index.json."""
+
+    version: str = ""
+    description: str = ""
+    api_version: str = ""
+    download: str = ""  # Path within the repo; empty means plugins/<name>
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> PluginIndexEntry:
+        """Create an entry from index data, ignoring unknown or missing keys."""
+        return cls(
+            version=str(data.get("version") or ""),
+            description=str(data.get("description") or ""),
+            api_version=str(data.get("api_version") or ""),
+            download=str(data.get("download") or ""),
+        )
+
 
 class PluginsPlugin(Plugin):
     """Plugin for browsing, installing, and managing plugins."""
 
+    # Plugins shipped with menu-kit; these can't be uninstalled
+    _BUNDLED: ClassVar[frozenset[str]] = frozenset(("settings", "plugins"))
+
+    # Seconds a fetched repository index is reused without revalidating
+    _INDEX_TTL: ClassVar[float] = 60.0
+
+    # Upper bound on concurrent index downloads
+    _MAX_FETCH_WORKERS: ClassVar[int] = 8
+
+    # Seconds browsing waits for a background index fetch before starting its own
+    _PREFETCH_WAIT: ClassVar[float] = 5.0
+
+    # Temp files in the index cache older than this are from interrupted writes
+    _STALE_TEMP_AGE: ClassVar[float] = 60.0
+
+    def __init__(self) -> None:
+        # Main menu selections and run() actions, keyed by the ID after "plugins:"
+        self._routes: dict[str, Callable[[PluginContext], None]] = {
+            "installed": self._show_installed,
+            "browse": self._show_browse,
+            "updates": self._check_updates,
+        }
+        # Main menu entries that never change, built once
+        self._browse_item = MenuItem(
+            id="plugins:browse",
+            title="Install New Plugins",
+            item_type=ItemType.SUBMENU,
+        )
+        self._updates_item = MenuItem(
+            id="plugins:updates",
+            title="Update Plugins",
+            item_type=ItemType.ACTION,
+        )
+        # Last installed plugins list, keyed by the rows it was built from
+        self._installed_items: tuple[tuple[tuple[str, str, str], ...], list[MenuItem]] | None = None
+        # Plugin directory names on disk, keyed by (path, mtime) of the directory
+        self._plugin_dirs: tuple[tuple[str, int], frozenset[str]] | None = None
+        # Repository indexes fetched this session: repo -> (fetched at, index)
+        self._index_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+        # Background index fetches not yet claimed by a browse menu
+        self._prefetches: dict[str, Future[dict[str, Any] | None]] = {}
+
     @property
     def cacheable(self) -> bool:
         """Plugins menu is always computed fresh - cheap and ensures availability."""
@@ -31,15 +128,14 @@ class PluginsPlugin(Plugin):
 
     def run(self, ctx: PluginContext, action: str = "") -> None:
         """Show plugins menu."""
-        if action == "installed":
-            self._show_installed(ctx)
-        elif action == "browse":
-            self._show_browse(ctx)
-        else:
-            self._show_main_menu(ctx)
+        self._routes.get(action, self._show_main_menu)(ctx)
 
     def _show_main_menu(self, ctx: PluginContext) -> None:
         """Show main plugins menu."""
+        # Browsing is usually the next step, so hide the index download behind
+        # the time spent reading this menu
+        self._prefetch_repo_indexes(ctx.config.plugins.repositories)
+
         while True:
             installed_count = len(ctx.get_installed_plugins())
             items = [
@@ -49,28 +145,21 @@ class PluginsPlugin(Plugin):
                     item_type=ItemType.SUBMENU,
                     badge=str(installed_count),
                 ),
-                MenuItem(
-                    id="plugins:browse",
-                    title="Install New Plugins",
-                    item_type=ItemType.SUBMENU,
-                ),
-                MenuItem(
-                    id="plugins:updates",
-                    title="Update Plugins",
-                    item_type=ItemType.ACTION,
-                ),
+                self._browse_item,
+                self._updates_item,
             ]
 
             selected = ctx.menu(items, prompt="Plugins")
             if selected is None:
                 return
 
-            if selected.id == "plugins:installed":
-                self._show_installed(ctx)
-            elif selected.id == "plugins:browse":
-                self._show_browse(ctx)
-            elif selected.id == "plugins:updates":
-                ctx.notify("Update check not yet implemented")
+            route = self._routes.get(selected.id.removeprefix("plugins:"))
+            if route is not None:
+                route(ctx)
+
+    def _check_updates(self, ctx: PluginContext) -> None:
+        """Check installed plugins for updates."""
+        ctx.notify("Update check not yet implemented")
 
     def _show_installed(self, ctx: PluginContext) -> None:
         """Show installed plugins."""
@@ -78,36 +167,37 @@ class PluginsPlugin(Plugin):
 
         while True:
             installed = ctx.get_installed_plugins()
-            items = []
-
-            for name, info in sorted(installed.items()):
-                # Get display mode for this plugin
-                mode = display_manager.get_mode(name)
-                mode_label = mode.value
+            modes = display_manager.get_modes(installed)
+            rows = tuple(
+                (name, info.version, modes[name].value) for name, info in installed.items()
+            )
 
-                # Determine if bundled
-                bundled_plugins = {"settings", "plugins"}
-                source = "bundled" if name in bundled_plugins else "installed"
+            # Only rebuild the items if a plugin, version or display mode changed
+            if self._installed_items is None or self._installed_items[0] != rows:
+                self._installed_items = (rows, self._build_installed_items(rows))
 
-                badge = f"{info.version} ({source}) | {mode_label}"
-
-                items.append(
-                    MenuItem(
-                        id=f"plugins:info:{name}",
-                        title=name,
-                        item_type=ItemType.ACTION,
-                        badge=badge,
-                    )
-                )
-
-            selected = ctx.menu(items, prompt="Installed Plugins")
+            selected = ctx.menu(self._installed_items[1], prompt="Installed Plugins")
             if selected is None:
                 return
 
             # Extract plugin name from ID
-            plugin_name = selected.id.replace("plugins:info:", "")
+            plugin_name = selected.id.removeprefix(_INFO_PREFIX)
             self._show_plugin_options(ctx, plugin_name, display_manager)
 
+    def _build_installed_items(self, rows: tuple[tuple[str, str, str], ...]) -> list[MenuItem]:
+        """Build the installed plugins list from (name, version, mode) rows."""
+        bundled = self._BUNDLED
+        action = ItemType.ACTION
+        return [
+            MenuItem(
+                id=f"{_INFO_PREFIX}{name}",
+                title=name,
+                item_type=action,
+                badge=f"{version} ({'bundled' if name in bundled else 'installed'}) | {mode_label}",
+            )
+            for name, version, mode_label in rows
+        ]
+
     def _show_plugin_options(
         self,
         ctx: PluginContext,
@@ -147,8 +237,7 @@ class PluginsPlugin(Plugin):
             ]
 
             # Add uninstall option for non-bundled plugins
-            bundled_plugins = {"settings", "plugins"}
-            if plugin_name not in bundled_plugins:
+            if plugin_name not in self._BUNDLED:
                 items.append(
                     MenuItem(
                         id=f"plugins:opt:{plugin_name}:uninstall",
@@ -195,37 +284,178 @@ class PluginsPlugin(Plugin):
             self._show_repo_plugins(ctx, repos[0])
             return
 
-        while True:
-            items = []
-            for repo in repos:
-                # Show "Official" for the official repo, path for others
-                title = "Official" if repo == self.OFFICIAL_REPO else repo
-                items.append(
-                    MenuItem(
-                        id=f"plugins:repo:{repo}",
-                        title=title,
-                        item_type=ItemType.SUBMENU,
-                    )
-                )
+        # The list itself needs no network; fetch the indexes in the background
+        # so the repo the user opens is likely warm by then
+        self._prefetch_repo_indexes(repos)
 
+        # Show "Official" for the official repo, path for others
+        items = [
+            MenuItem(
+                id=f"{_REPO_PREFIX}{repo}",
+                title="Official" if repo == self.OFFICIAL_REPO else repo,
+                item_type=ItemType.SUBMENU,
+            )
+            for repo in repos
+        ]
+
+        while True:
             selected = ctx.menu(items, prompt="Select Repository")
             if selected is None:
                 return
 
-            if selected.id.startswith("plugins:repo:"):
-                repo = selected.id.replace("plugins:repo:", "")
+            if selected.id.startswith(_REPO_PREFIX):
+                repo = selected.id.removeprefix(_REPO_PREFIX)
                 self._show_repo_plugins(ctx, repo)
 
     def _fetch_repo_index(self, repo: str) -> dict[str, Any] | None:
-        """Fetch index.json from a GitHub repository."""
+        """Fetch index.json from a GitHub repository, reusing recent fetches."""
+        cached = self._index_cache.get(repo)
+        if cached is not None and time.monotonic() - cached[0] < self._INDEX_TTL:
+            return cached[1]
+
+        # Wait for a background fetch still in flight. A finished one either
+        # failed or has gone stale (a success would have hit the cache above),
+        # as has one taking too long, so those fall back to fetching directly
+        pending = self._prefetches.pop(repo, None)
+        if pending is not None and not pending.done():
+            try:
+                index = pending.result(timeout=self._PREFETCH_WAIT)
+            except Exception:  # Includes TimeoutError
+                index = None
+            if index is not None:
+                return index
+
+        return self._refresh_repo_index(repo)
+
+    def _refresh_repo_index(self, repo: str) -> dict[str, Any] | None:
+        """Download a repository index and remember it for the TTL."""
+        now = time.monotonic()
+        index = self._download_repo_index(repo)
+        if index is not None:
+            self._index_cache[repo] = (now, index)
+        return index
+
+    def _prefetch_repo_indexes(self, repos: Sequence[str]) -> None:
+        """Start fetching indexes that aren't cached or already being fetched.
+
+        Each fetch runs on a daemon thread so quitting the menu never waits
+        for the network.
+        """
+        now = time.monotonic()
+        for repo in repos[: self._MAX_FETCH_WORKERS]:
+            cached = self._index_cache.get(repo)
+            if repo in self._prefetches or (
+                cached is not None and now - cached[0] < self._INDEX_TTL
+            ):
+                continue
+
+            future: Future[dict[str, Any] | None] = Future()
+            self._prefetches[repo] = future
+            threading.Thread(
+                target=self._run_prefetch,
+                args=(repo, future),
+                name=f"menu-kit-prefetch-{repo}",
+                daemon=True,
+            ).start()
+
+    def _run_prefetch(self, repo: str, future: Future[dict[str, Any] | None]) -> None:
+        """Resolve a prefetch future with the downloaded index."""
+        try:
+            future.set_result(self._refresh_repo_index(repo))
+        except Exception as e:
+            future.set_exception(e)
+
+    def _download_repo_index(self, repo: str) -> dict[str, Any] | None:
+        """Download index.json from a GitHub repository.
+
+        The last good response is kept on disk with its ETag/Last-Modified
+        validators, so an unchanged index is revalidated with a 304 instead
+        of being downloaded again.
+        """
         url = f"https://raw.githubusercontent.com/{repo}/main/index.json"
+        body_path, meta_path = self._index_cache_paths(repo)
+        request = urllib.request.Request(url)
+
+        cached_body: bytes | None = None
+        try:
+            cached_body = body_path.read_bytes()
+            meta = json.loads(meta_path.read_bytes())
+            if meta.get("etag"):
+                request.add_header("If-None-Match", meta["etag"])
+            if meta.get("last_modified"):
+                request.add_header("If-Modified-Since", meta["last_modified"])
+        except (OSError, ValueError, AttributeError):
+            pass  # No usable cache - make an unconditional request
+
+        validators: dict[str, str | None] | None = None
         try:
-            with urllib.request.urlopen(url, timeout=10) as response:
-                result: dict[str, Any] = json.loads(response.read().decode("utf-8"))
-                return result
+            with urllib.request.urlopen(request, timeout=10) as response:
+                body = response.read()
+                validators = {
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                }
+        except urllib.error.HTTPError as e:
+            if e.code != 304 or cached_body is None:
+                return None
+            body = cached_body
         except Exception:
             return None
 
+        try:
+            result: dict[str, Any] = _json_loads(body)
+        except ValueError:
+            return None
+
+        plugins = result.get("plugins")
+        result["plugins"] = {
+            name: PluginIndexEntry.from_dict(info)
+            for name, info in (plugins.items() if isinstance(plugins, dict) else ())
+            if isinstance(info, dict)
+        }
+
+        if validators is not None:
+            self._write_index_cache(body_path, meta_path, body, validators)
+        return result
+
+    def _index_cache_paths(self, repo: str) -> tuple[Path, Path]:
+        """Get the cached index body and validator sidecar paths for a repo."""
+        slug = repo.replace("/", "__")
+        index_dir = get_cache_dir() / "index"
+        return index_dir / f"{slug}.json", index_dir / f"{slug}.meta"
+
+    def _write_index_cache(
+        self,
+        body_path: Path,
+        meta_path: Path,
+        body: bytes,
+        validators: dict[str, str | None],
+    ) -> None:
+        """Persist an index response. Failures are ignored.
+
+        The body is written before the sidecar, so a sidecar never describes
+        a body older than itself.
+        """
+        if write_atomic(body_path, body):
+            write_atomic(meta_path, json.dumps(validators).encode())
+        self._remove_stale_temp_files(body_path.parent)
+
+    def _remove_stale_temp_files(self, directory: Path) -> None:
+        """Delete temp files left behind by writes that never finished.
+
+        Prefetch threads are daemons, so one killed at exit mid-write leaves
+        its temp file. Old ones can't be a write in progress. Failures are
+        ignored.
+        """
+        cutoff = time.time() - self._STALE_TEMP_AGE
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if entry.name.endswith(".tmp") and entry.stat().st_mtime < cutoff:
+                        os.unlink(entry.path)
+        except OSError:
+            pass
+
     def _show_repo_plugins(self, ctx: PluginContext, repo: str) -> None:
         """Show plugins available in a repository."""
         index = self._fetch_repo_index(repo)
@@ -233,91 +463,115 @@ class PluginsPlugin(Plugin):
             ctx.notify(f"Failed to fetch plugins from {repo}")
             return
 
-        installed = ctx.get_installed_plugins()
-
-        while True:
-            items = []
-            plugins = index.get("plugins", {})
-
-            for name, info in sorted(plugins.items()):
-                is_installed = name in installed
-                badge = f"v{info.get('version', '?')}"
-                if is_installed:
-                    badge += " (installed)"
+        plugins = index.get("plugins", {})
+        title = "Official" if repo == self.OFFICIAL_REPO else repo
 
-                items.append(
-                    MenuItem(
-                        id=f"plugins:available:{repo}:{name}",
-                        title=name,
-                        item_type=ItemType.ACTION,
-                        badge=badge,
-                        metadata={"repo": repo, "info": info},
-                    )
-                )
+        # The index doesn't change while this menu is open, but installing from
+        # it does change the installed set, so rebuild only when that changes
+        installed: frozenset[str] | None = None
+        items: list[MenuItem] = []
 
-            if not items:
-                items.append(
-                    MenuItem(
-                        id="plugins:browse:empty",
-                        title="No plugins available",
-                        item_type=ItemType.INFO,
-                    )
-                )
+        while True:
+            current = self._installed_names(ctx)
+            if current != installed:
+                installed = current
+                items = self._build_repo_items(repo, plugins, installed)
 
-            title = "Official" if repo == self.OFFICIAL_REPO else repo
             selected = ctx.menu(items, prompt=title)
             if selected is None:
                 return
 
-            if selected.id.startswith("plugins:available:"):
+            if selected.id.startswith(_AVAILABLE_PREFIX):
                 parts = selected.id.split(":", 3)
                 plugin_name = parts[3]
-                plugin_info = plugins.get(plugin_name, {})
+                plugin_info = plugins.get(plugin_name) or PluginIndexEntry()
                 self._show_plugin_install_options(
                     ctx, repo, plugin_name, plugin_info, plugin_name in installed
                 )
 
+    def _installed_names(self, ctx: PluginContext) -> frozenset[str]:
+        """Names of loaded plugins plus plugin directories on disk.
+
+        Plugins installed this session are on disk but not loaded yet. The
+        directory listing is cached by the directory's mtime, so this is one
+        stat unless a plugin has been added or removed.
+        """
+        plugins_dir = get_data_dir() / "plugins"
+        try:
+            stamp = (str(plugins_dir), os.stat(plugins_dir).st_mtime_ns)
+            if self._plugin_dirs is None or self._plugin_dirs[0] != stamp:
+                with os.scandir(plugins_dir) as it:
+                    names = frozenset(entry.name for entry in it if entry.is_dir())
+                self._plugin_dirs = (stamp, names)
+        except OSError:
+            # Missing or unreadable; the loaded plugins are all we know about
+            return frozenset(ctx.get_installed_plugins())
+
+        return self._plugin_dirs[1].union(ctx.get_installed_plugins())
+
+    def _build_repo_items(
+        self,
+        repo: str,
+        plugins: dict[str, PluginIndexEntry],
+        installed: frozenset[str],
+    ) -> list[MenuItem]:
+        """Build the list of plugins available in a repository."""
+        items = [
+            MenuItem(
+                id=f"{_AVAILABLE_PREFIX}{repo}:{name}",
+                title=name,
+                item_type=ItemType.ACTION,
+                badge=f"v{info.version or '?'}" + (" (installed)" if name in installed else ""),
+                metadata={"repo": repo, "info": info},
+            )
+            for name, info in sorted(plugins.items())
+        ]
+
+        return items or [
+            MenuItem(
+                id="plugins:browse:empty",
+                title="No plugins available",
+                item_type=ItemType.INFO,
+            )
+        ]
+
     def _show_plugin_install_options(
         self,
         ctx: PluginContext,
         repo: str,
         plugin_name: str,
-        plugin_info: dict[str, Any],
+        plugin_info: PluginIndexEntry,
         is_installed: bool,
     ) -> None:
         """Show install/info options for a plugin."""
-        while True:
-            items = [
-                MenuItem(
-                    id=f"plugins:detail:{plugin_name}:desc",
-                    title=plugin_info.get("description", "No description"),
-                    item_type=ItemType.INFO,
-                ),
-            ]
-
-            if is_installed:
-                items.append(
-                    MenuItem(
-                        id=f"plugins:detail:{plugin_name}:installed",
-                        title="Already installed",
-                        item_type=ItemType.INFO,
-                    )
-                )
-            else:
-                items.append(
-                    MenuItem(
-                        id=f"plugins:detail:{plugin_name}:install",
-                        title="Install",
-                        item_type=ItemType.ACTION,
-                    )
-                )
+        # Nothing here changes while the menu is open, so build it once
+        items = [
+            MenuItem(
+                id=f"plugins:detail:{plugin_name}:desc",
+                title=plugin_info.description or "No description",
+                item_type=ItemType.INFO,
+            ),
+            MenuItem(
+                id=f"plugins:detail:{plugin_name}:installed",
+                title="Already installed",
+                item_type=ItemType.INFO,
+            )
+            if is_installed
+            else MenuItem(
+                id=f"plugins:detail:{plugin_name}:install",
+                title="Install",
+                item_type=ItemType.ACTION,
+            ),
+        ]
 
+        while True:
             selected = ctx.menu(items, prompt=plugin_name.title())
             if selected is None:
                 return
 
             if selected.id.endswith(":install"):
                 if self._install_plugin(ctx, repo, plugin_name, plugin_info):
+                    ctx.invalidate_plugins()
                     ctx.show_result(
                         f"Plugin '{plugin_name}' installed successfully",
                         prompt="Install Plugin",
@@ -334,60 +588,164 @@ class PluginsPlugin(Plugin):
         ctx: PluginContext,
         repo: str,
         plugin_name: str,
-        plugin_info: dict[str, Any],
+        plugin_info: PluginIndexEntry,
     ) -> bool:
         """Download and install a plugin from a repository."""
+        results = self._install_plugins_batch(ctx, repo, [(plugin_name, plugin_info)])
+        return results[plugin_name]
+
+    def _install_plugins_batch(
+        self,
+        ctx: PluginContext,
+        repo: str,
+        plugins: Sequence[tuple[str, PluginIndexEntry]],
+    ) -> dict[str, bool]:
+        """Download and install several plugins from a repository concurrently.
+
+        Returns whether each plugin was installed, keyed by name.
+        """
         plugins_dir = get_data_dir() / "plugins"
         plugins_dir.mkdir(parents=True, exist_ok=True)
 
+        if len(plugins) == 1:
+            name, info = plugins[0]
+            return {name: self._download_plugin(plugins_dir, repo, name, info)}
+
+        workers = min(self._MAX_FETCH_WORKERS, len(plugins))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                name: executor.submit(self._download_plugin, plugins_dir, repo, name, info)
+                for name, info in plugins
+            }
+            return {name: future.result() for name, future in futures.items()}
+
+    def _download_plugin(
+        self,
+        plugins_dir: Path,
+        repo: str,
+        plugin_name: str,
+        plugin_info: PluginIndexEntry,
+    ) -> bool:
+        """Download one plugin into the plugins directory."""
         target_dir = plugins_dir / plugin_name
         if target_dir.exists():
             return False  # Already exists
 
-        # Get download path from index
-        download_path = plugin_info.get("download", f"plugins/{plugin_name}")
+        # Get download path from index. A .zip is a whole plugin package in
+        # one request; anything else is a directory holding __init__.py
+        download_path = plugin_info.download or f"plugins/{plugin_name}"
+        is_archive = download_path.endswith(".zip")
+
+        url = f"https://raw.githubusercontent.com/{repo}/main/{download_path}"
+        if not is_archive:
+            url = f"{url}/__init__.py"
 
-        # Download __init__.py (main plugin file)
-        base_url = f"https://raw.githubusercontent.com/{repo}/main/{download_path}"
-        init_url = f"{base_url}/__init__.py"
+        # Reinstalling a version we've downloaded before needs no network
+        cache_path = self._download_cache_path(repo, plugin_name, plugin_info)
+        is_temp = True
 
         try:
             # Create plugin directory
             target_dir.mkdir(parents=True, exist_ok=True)
 
-            # Download main file
             init_path = target_dir / "__init__.py"
-            with urllib.request.urlopen(init_url, timeout=30) as response:
-                init_path.write_bytes(response.read())
+
+            if cache_path is not None and cache_path.is_file():
+                download, is_temp = cache_path, False
+            else:
+                download = self._stream_to_temp(url, target_dir)
+
+            # Only a download that installed cleanly is cached
+            if is_archive:
+                with zipfile.ZipFile(download) as archive:
+                    archive.extractall(target_dir)
+                if not init_path.is_file():
+                    raise ValueError(f"{download_path} has no top-level __init__.py")
+                if is_temp:
+                    if cache_path is not None:
+                        self._store_download(download, cache_path)
+                    download.unlink()
+            else:
+                # A truncated or non-Python download fails here, not at load time
+                compile(download.read_bytes(), str(init_path), "exec")
+                if is_temp:
+                    os.replace(download, init_path)
+                    if cache_path is not None:
+                        self._store_download(init_path, cache_path)
+                else:
+                    shutil.copyfile(download, init_path)
 
             return True
         except Exception:
-            # Clean up on failure
+            # Clean up on failure, and drop a cached copy that couldn't be
+            # installed so the next attempt downloads it again
             if target_dir.exists():
                 shutil.rmtree(target_dir)
+            if not is_temp and cache_path is not None:
+                cache_path.unlink(missing_ok=True)
             return False
 
+    def _stream_to_temp(self, url: str, directory: Path) -> Path:
+        """Stream a URL to a temp file in directory and return its path.
+
+        Going through a temp file means a partial download never leaves a
+        truncated file in place of the real one.
+        """
+        with (
+            urllib.request.urlopen(url, timeout=30) as response,
+            tempfile.NamedTemporaryFile(dir=directory, delete=False) as tmp,
+        ):
+            shutil.copyfileobj(response, tmp, 1 << 16)
+            tmp.flush()
+            os.fsync(tmp.fileno())
+        return Path(tmp.name)
+
+    def _download_cache_path(
+        self, repo: str, plugin_name: str, plugin_info: PluginIndexEntry
+    ) -> Path | None:
+        """Get the download cache path for a plugin version, if it has one.
+
+        Entries are keyed by repo, name, version and download path. Without a
+        version there is no way to tell a stale download from a fresh one.
+        """
+        version = plugin_info.version
+        if not version:
+            return None
+        download_path = plugin_info.download or f"plugins/{plugin_name}"
+        key = f"{repo}:{plugin_name}:{version}:{download_path}"
+        return get_cache_dir() / "downloads" / hashlib.sha256(key.encode()).hexdigest()
+
+    def _store_download(self, source: Path, cache_path: Path) -> None:
+        """Copy a downloaded file into the download cache. Failures are ignored."""
+        try:
+            data = source.read_bytes()
+        except OSError:
+            return
+        write_atomic(cache_path, data)
+
     def _uninstall_plugin(self, ctx: PluginContext, plugin_name: str) -> bool:
         """Uninstall a plugin by removing its directory."""
         plugins_dir = get_data_dir() / "plugins"
         target_dir = plugins_dir / plugin_name
 
-        # Also check for symlinks
-        if target_dir.is_symlink():
-            target_dir.unlink()
-            # Clear items from database and unregister from loader
-            ctx.database.delete_items_by_plugin(plugin_name)
-            ctx.unregister_plugin(plugin_name)
-            return True
+        # One lstat tells a symlinked plugin (unlink just the link, never its
+        # source) from a real directory
+        try:
+            mode = os.lstat(target_dir).st_mode
+        except OSError:
+            return False  # Missing, or the plugins path isn't a directory
 
-        if target_dir.exists() and target_dir.is_dir():
+        if stat.S_ISLNK(mode):
+            os.unlink(target_dir)
+        elif stat.S_ISDIR(mode):
             shutil.rmtree(target_dir)
-            # Clear items from database and unregister from loader
-            ctx.database.delete_items_by_plugin(plugin_name)
-            ctx.unregister_plugin(plugin_name)
-            return True
+        else:
+            return False
 
-        return False
+        # Clear items from database and unregister from loader
+        ctx.database.delete_items_by_plugin(plugin_name)
+        ctx.unregister_plugin(plugin_name)
+        return True
 
     def index(self, ctx: PluginContext) -> list[MenuItem]:
         """Register plugins menu in main menu."""
@@ -88,7 +88,7 @@ class SettingsPlugin(Plugin):
                 return
 
             # Extract backend name from ID
-            backend = selected.id.split(":")[-1]
+            backend = selected.id.rpartition(":")[2]
             ctx.config.menu.backend = "" if backend == "auto" else backend
             ctx.config.save()
             ctx.notify(f"Backend set to {backend}")
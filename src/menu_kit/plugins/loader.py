@@ -5,8 +5,12 @@ from __future__ import annotations
 import contextlib
 import importlib
 import importlib.util
+import os
 import sys
+from collections.abc import Iterable, Mapping
+from dataclasses import replace
 from pathlib import Path
+from types import MappingProxyType
 from typing import TYPE_CHECKING
 
 from menu_kit.core.config import get_config_dir, get_data_dir
@@ -32,9 +36,11 @@ class PluginLoader:
         self.database = database
         self.menu_backend = menu_backend
         self._plugins: dict[str, Plugin] = {}
+        # Live read-only view handed to callers, so they can't mutate the registry
+        self._plugins_view: Mapping[str, Plugin] = MappingProxyType(self._plugins)
         self._contexts: dict[str, PluginContext] = {}
 
-    def load_all(self) -> dict[str, Plugin]:
+    def load_all(self) -> Mapping[str, Plugin]:
         """Load all available plugins."""
         # Load built-in plugins first
         self._load_builtin_plugins()
@@ -49,24 +55,31 @@ class PluginLoader:
         if local_plugins_dir.exists():
             self._load_plugins_from_dir(local_plugins_dir)
 
-        return self._plugins
+        return self._plugins_view
 
     def _load_builtin_plugins(self) -> None:
         """Load built-in plugins."""
         from menu_kit.plugins.builtin import plugins, settings
 
-        for module in [settings, plugins]:
-            if hasattr(module, "create_plugin"):
-                plugin = module.create_plugin()
-                self._register_plugin(plugin)
+        self.register_all(
+            module.create_plugin()
+            for module in (settings, plugins)
+            if hasattr(module, "create_plugin")
+        )
 
     def _load_plugins_from_dir(self, directory: Path) -> None:
         """Load plugins from a directory."""
-        for item in directory.iterdir():
-            if item.is_dir() and (item / "__init__.py").exists():
+        # scandir reports entry types from the directory listing itself, and
+        # sorting makes the load order (and so duplicate resolution) stable
+        with os.scandir(directory) as it:
+            entries = sorted(it, key=lambda e: e.name)
+
+        for entry in entries:
+            item = Path(entry.path)
+            if entry.is_dir() and (item / "__init__.py").exists():
                 # Package plugin
                 self._load_plugin_package(item)
-            elif item.is_file() and item.suffix == ".py" and not item.name.startswith("_"):
+            elif entry.is_file() and item.suffix == ".py" and not item.name.startswith("_"):
                 # Single-file plugin
                 self._load_plugin_file(item)
 
@@ -109,9 +122,18 @@ class PluginLoader:
         except Exception as e:
             print(f"Failed to load plugin from {file_path}: {e}")
 
+    def register_all(self, plugins: Iterable[Plugin]) -> None:
+        """Register several plugins in order; the last of any duplicate name wins."""
+        for plugin in plugins:
+            self._register_plugin(plugin)
+
     def _register_plugin(self, plugin: Plugin) -> None:
         """Register a loaded plugin."""
         name = plugin.info.name
+        # Later overrides earlier, so a local plugin can replace an installed
+        # or bundled one; the replaced plugin is torn down first
+        self.unregister_plugin(name)
+
         self._plugins[name] = plugin
 
         # Create context for this plugin
@@ -140,9 +162,9 @@ class PluginLoader:
         """Get the context for a plugin."""
         return self._contexts.get(name)
 
-    def get_all_plugins(self) -> dict[str, Plugin]:
-        """Get all loaded plugins."""
-        return self._plugins
+    def get_all_plugins(self) -> Mapping[str, Plugin]:
+        """Get a read-only, live view of all loaded plugins."""
+        return self._plugins_view
 
     def unregister_plugin(self, name: str) -> bool:
         """Unregister a plugin by name.
@@ -179,8 +201,8 @@ class PluginLoader:
         from menu_kit.plugins.base import MenuCancelled
 
         # Parse plugin:action format
-        if ":" in name and not action:
-            name, action = name.split(":", 1)
+        if not action:
+            name, _, action = name.partition(":")
 
         plugin = self.get_plugin(name)
         ctx = self.get_context(name)
@@ -205,8 +227,7 @@ class PluginLoader:
             cacheable_only: If True, only index cacheable plugins (for --rebuild).
                            If False, index all plugins (legacy behavior).
         """
-        # Clear cached items first (removes stale items from uninstalled plugins)
-        self.database.clear_items()
+        all_items: list[MenuItem] = []
 
         for name, plugin in self._plugins.items():
             # Skip non-cacheable plugins during rebuild (they're indexed at runtime)
@@ -220,13 +241,15 @@ class PluginLoader:
                 continue
 
             try:
-                items = plugin.index(ctx)
-                for item in items:
-                    item.plugin = name
-                self.database.add_items(items)
+                # Items are frozen, so tag them with their plugin by copying
+                all_items.extend(replace(item, plugin=name) for item in plugin.index(ctx))
             except Exception as e:
                 print(f"Error indexing plugin {name}: {e}")
 
+        # Swap in the new items in one transaction; clearing first removes stale
+        # items from uninstalled plugins
+        self.database.replace_items(all_items)
+
         # Update rebuild timestamp
         self.database.set_last_rebuilt()
 
@@ -252,10 +275,7 @@ class PluginLoader:
                 continue
 
             try:
-                plugin_items = plugin.index(ctx)
-                for item in plugin_items:
-                    item.plugin = name
-                items.extend(plugin_items)
+                items.extend(replace(item, plugin=name) for item in plugin.index(ctx))
             except Exception as e:
                 print(f"Error indexing dynamic plugin {name}: {e}")
 
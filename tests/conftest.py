@@ -3,14 +3,17 @@
 from __future__ import annotations
 
 import tempfile
+import threading
 from collections.abc import Generator
 from pathlib import Path
+from typing import Any
 from unittest.mock import patch
 
 import pytest
 
 from menu_kit.core.config import Config
 from menu_kit.core.database import Database
+from menu_kit.plugins.builtin.plugins import PluginsPlugin
 
 
 @pytest.fixture(autouse=True)
@@ -39,10 +42,35 @@ def sandbox_environment() -> Generator[Path, None, None]:
             patch("menu_kit.plugins.loader.get_data_dir", return_value=data_dir),
             patch("menu_kit.plugins.loader.get_config_dir", return_value=config_dir),
             patch("menu_kit.plugins.builtin.plugins.get_data_dir", return_value=data_dir),
+            patch("menu_kit.plugins.builtin.plugins.get_cache_dir", return_value=cache_dir),
         ):
             yield sandbox
 
 
+@pytest.fixture(autouse=True)
+def offline_index_downloads(request: pytest.FixtureRequest) -> Generator[None, None, None]:
+    """Serve an empty repository index instead of downloading one.
+
+    The plugins menu prefetches indexes in the background as soon as it opens,
+    so any test reaching it would otherwise start real downloads. Tests that
+    need plugins in the index mock it on top of this; network-marked tests get
+    the real download. Prefetch threads are joined before the test ends, so
+    none outlive it.
+    """
+    if request.node.get_closest_marker("network") is not None:
+        yield
+        return
+
+    def empty_index(repo: str) -> dict[str, Any]:
+        return {"version": 1, "plugins": {}}
+
+    with patch.object(PluginsPlugin, "_download_repo_index", side_effect=empty_index):
+        yield
+        for thread in threading.enumerate():
+            if thread.name.startswith("menu-kit-prefetch-"):
+                thread.join()
+
+
 @pytest.fixture
 def temp_dir() -> Generator[Path, None, None]:
     """Create a temporary directory for tests."""
@@ -52,7 +80,7 @@ def temp_dir() -> Generator[Path, None, None]:
 
 @pytest.fixture
 def disable_notify_send() -> Generator[None, None, None]:
-    """Disable notify-send so notifications fall back to print (for capsys capture)."""
+    """Disable notify-send so notifications fall back to stdout (for capsys capture)."""
 
     def mock_which(cmd: str) -> str | None:
         if cmd == "notify-send":
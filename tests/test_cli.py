@@ -2,7 +2,13 @@
 
 from __future__ import annotations
 
-from menu_kit.cli import parse_args
+import subprocess
+import sys
+
+import pytest
+
+from menu_kit import __version__
+from menu_kit.cli import _build_parser, _fast_parse, parse_args
 
 
 def test_parse_args_defaults() -> None:
@@ -88,3 +94,87 @@ def test_parse_args_combined() -> None:
     assert args.plugin == "network"
     assert args.backend == "rofi"
     assert args.dry_run is True
+
+
+def test_cli_import_defers_runner() -> None:
+    """Importing the CLI must not pull in the runner or plugin loader."""
+    code = (
+        "import sys, menu_kit.cli; "
+        "print(any(m in sys.modules for m in "
+        "('menu_kit.core.runner', 'menu_kit.plugins.loader')))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == "False"
+
+
+def test_parse_args_version(capsys: pytest.CaptureFixture[str]) -> None:
+    """Test --version prints the version and exits."""
+    with pytest.raises(SystemExit) as exc_info:
+        parse_args(["-V"])
+
+    assert exc_info.value.code == 0
+    assert capsys.readouterr().out.strip() == f"menu-kit {__version__}"
+
+
+def test_parse_args_version_after_separator_is_selection() -> None:
+    """Test --version after -- is treated as a selection."""
+    args = parse_args(["--", "--version"])
+    assert args.selections == ["--version"]
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        [],
+        ["-p", "network"],
+        ["--plugin", "files:recent"],
+        ["--plugin=files:recent"],
+        ["-b", "rofi", "--backend-args", "x", "-t"],
+        ["--backend=fuzzel", "--print", "--dry-run", "--rebuild"],
+        ["-p", "a", "-p", "b"],
+        ["--", "Files", "Documents"],
+        ["-t", "--", "-p", "x"],
+        ["--"],
+    ],
+)
+def test_fast_parse_matches_argparse(argv: list[str]) -> None:
+    """Test the fast path gives the same result as argparse."""
+    fast = _fast_parse(argv)
+
+    assert fast is not None
+    assert fast == _build_parser().parse_args(argv)
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["--help"],
+        ["--plug", "x"],
+        ["-tp", "x"],
+        ["-pnetwork"],
+        ["-p"],
+        ["-p", "-t"],
+        ["--print=yes"],
+        ["Files"],
+        ["--", "a", "--", "b"],
+    ],
+)
+def test_fast_parse_defers_to_argparse(argv: list[str]) -> None:
+    """Test unusual arguments fall back to argparse."""
+    assert _fast_parse(argv) is None
+
+
+def test_fast_parse_returns_fresh_selections() -> None:
+    """Test each fast-path parse gets its own selections list."""
+    first = _fast_parse([])
+    assert first is not None
+    first.selections.append("x")
+
+    second = _fast_parse([])
+    assert second is not None
+    assert second.selections == []
@@ -3,8 +3,17 @@
 from __future__ import annotations
 
 from pathlib import Path
+from unittest.mock import patch
 
-from menu_kit.core.config import Config
+import pytest
+
+from menu_kit.core.config import (
+    Config,
+    get_cache_dir,
+    get_config_dir,
+    get_data_dir,
+    write_atomic,
+)
 
 
 def test_default_config() -> None:
@@ -33,7 +42,7 @@ def test_config_from_dict() -> None:
     config = Config.from_dict(data)
 
     assert config.menu.backend == "rofi"
-    assert config.menu.rofi.args == ["-show-icons"]
+    assert config.menu.rofi.args == ("-show-icons",)
     assert config.display.submenu_prefix == ">> "
     assert config.frequency_tracking is False
 
@@ -126,3 +135,63 @@ def test_config_save_creates_directory(temp_dir: Path) -> None:
     config.save(config_path)
 
     assert config_path.exists()
+
+
+def test_config_load_uses_cache(temp_dir: Path, sandbox_environment: Path) -> None:
+    """Test that an unchanged config file is loaded from the cache, not re-parsed."""
+    config_path = temp_dir / "config.toml"
+    config_path.write_text('[menu]\nbackend = "rofi"\n')
+
+    Config.load(config_path)
+    assert (sandbox_environment / "cache" / "config.json").exists()
+
+    with patch("tomllib.loads", side_effect=AssertionError("TOML was re-parsed")):
+        config = Config.load(config_path)
+
+    assert config.menu.backend == "rofi"
+
+
+def test_config_load_cache_invalidated_on_change(temp_dir: Path) -> None:
+    """Test that editing the config file invalidates the cache."""
+    config_path = temp_dir / "config.toml"
+    config_path.write_text('[menu]\nbackend = "rofi"\n')
+    Config.load(config_path)
+
+    config_path.write_text('[menu]\nbackend = "fuzzel"\n')
+    config = Config.load(config_path)
+
+    assert config.menu.backend == "fuzzel"
+
+
+def test_xdg_dirs_respect_env(monkeypatch: pytest.MonkeyPatch, temp_dir: Path) -> None:
+    """Test that XDG base directory env vars are honoured and cached."""
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(temp_dir / "config"))
+    monkeypatch.setenv("XDG_CACHE_HOME", str(temp_dir / "cache"))
+    monkeypatch.setenv("XDG_DATA_HOME", "relative/ignored")
+    for func in (get_config_dir, get_cache_dir, get_data_dir):
+        func.cache_clear()
+
+    try:
+        assert get_config_dir() == temp_dir / "config" / "menu-kit"
+        assert get_cache_dir() == temp_dir / "cache" / "menu-kit"
+        assert get_data_dir() == Path.home() / ".local" / "share" / "menu-kit"
+
+        # Cached for the rest of the process
+        monkeypatch.setenv("XDG_CONFIG_HOME", str(temp_dir / "other"))
+        assert get_config_dir() == temp_dir / "config" / "menu-kit"
+    finally:
+        for func in (get_config_dir, get_cache_dir, get_data_dir):
+            func.cache_clear()
+
+
+def test_write_atomic(temp_dir: Path) -> None:
+    """Test that write_atomic replaces the file and leaves no temp files behind."""
+    path = temp_dir / "nested" / "file.bin"
+
+    assert write_atomic(path, b"first") is True
+    assert write_atomic(path, b"second") is True
+    assert path.read_bytes() == b"second"
+    assert [p.name for p in path.parent.iterdir()] == ["file.bin"]
+
+    # A parent that is a file can't be written into
+    assert write_atomic(path / "child", b"data") is False
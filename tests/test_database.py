@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import dataclasses
+
+import pytest
+
 from menu_kit.core.database import Database, ItemType, MenuItem
 
 
@@ -196,3 +200,74 @@ def test_item_metadata(database: Database) -> None:
     retrieved = database.get_item("test")
     assert retrieved is not None
     assert retrieved.metadata == {"custom": "data", "count": 42}
+
+
+def test_menu_item_action_from_id() -> None:
+    """Test that the action defaults to the part of the ID after the first colon."""
+    assert MenuItem(id="files:recent", title="Recent").action == "recent"
+    assert MenuItem(id="files:open:a:b", title="Open").action == "open:a:b"
+    assert MenuItem(id="settings", title="Settings").action == ""
+
+
+def test_menu_item_action_follows_replaced_id() -> None:
+    """Test that a copy with a new ID derives its action from that ID."""
+    item = MenuItem(id="files:recent", title="Recent")
+
+    assert dataclasses.replace(item, id="files:open").action == "open"
+
+
+def test_menu_item_action_survives_roundtrip(database: Database) -> None:
+    """Test that items read back from the database have their action parsed."""
+    database.add_item(MenuItem(id="files:recent", title="Recent", plugin="files"))
+
+    retrieved = database.get_item("files:recent")
+
+    assert retrieved is not None
+    assert retrieved.action == "recent"
+
+
+def test_replace_items(database: Database) -> None:
+    """Test that replace_items swaps the whole item set."""
+    database.add_items(
+        [
+            MenuItem(id="old:1", title="Old 1", plugin="old"),
+            MenuItem(id="keep:1", title="Keep 1", plugin="keep"),
+        ]
+    )
+
+    database.replace_items(
+        [
+            MenuItem(id="keep:1", title="Keep 1 (renamed)", plugin="keep"),
+            MenuItem(id="new:1", title="New 1", plugin="new"),
+        ]
+    )
+
+    assert database.get_item("old:1") is None
+    kept = database.get_item("keep:1")
+    assert kept is not None
+    assert kept.title == "Keep 1 (renamed)"
+    assert database.get_item("new:1") is not None
+
+
+def test_in_memory_database_persists_between_operations() -> None:
+    """Test that an in-memory database keeps its data and is private."""
+    first = Database.in_memory()
+    second = Database.in_memory()
+
+    first.add_item(MenuItem(id="test:1", title="Test 1"))
+
+    assert first.get_item("test:1") is not None
+    assert second.get_item("test:1") is None
+
+
+def test_menu_item_is_immutable() -> None:
+    """Test that items are frozen and copied with dataclasses.replace."""
+    item = MenuItem(id="test:item", title="Test Item")
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        item.plugin = "test"  # type: ignore[misc]
+
+    tagged = dataclasses.replace(item, plugin="test")
+    assert tagged.plugin == "test"
+    assert tagged.action == "item"
+    assert item.plugin is None
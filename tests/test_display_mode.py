@@ -140,6 +140,26 @@ class TestDisplayModeManager:
         mode2 = manager.get_mode("testplugin")
         assert mode2 == DisplayMode.SUBMENU
 
+    def test_get_modes_matches_get_mode(self, temp_dir: Path) -> None:
+        """Bulk lookup returns the same modes as per-plugin lookups."""
+        config = Config.load(temp_dir / "config.toml")
+        database = Database(temp_dir / "test.db")
+        manager = DisplayModeManager(config, database)
+
+        database.add_items(
+            [MenuItem(id=f"big:{i}", title=f"Item {i}", plugin="big") for i in range(25)]
+            + [MenuItem(id="small:0", title="Item", plugin="small")]
+        )
+        manager.set_mode("pinned", DisplayMode.SUBMENU)
+
+        names = ["big", "small", "pinned", "unknown"]
+        modes = manager.get_modes(names)
+
+        assert modes == {name: manager.get_mode(name) for name in names}
+        assert modes["big"] == DisplayMode.SUBMENU
+        assert modes["small"] == DisplayMode.INLINE
+        assert modes["pinned"] == DisplayMode.SUBMENU
+
 
 class TestDisplayModeConfig:
     """Tests for display mode configuration."""
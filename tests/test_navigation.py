@@ -19,6 +19,7 @@ from menu_kit.plugins.builtin.plugins import PluginsPlugin
 from menu_kit.plugins.builtin.settings import SettingsPlugin
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
     from pathlib import Path
 
 
@@ -63,13 +64,13 @@ class MockBackend(MenuBackend):
         if selection_id is None:
             return MenuResult(cancelled=False, selected=None)
 
-        # Find the item by ID (handle back button)
-        for item in items:
-            if item.id == selection_id:
-                return MenuResult(cancelled=False, selected=item)
+        # Find the item by ID (handle back button); reversed so the first
+        # item with a duplicate ID wins, as with a linear scan
+        by_id = {item.id: item for item in reversed(items)}
+        found = by_id.get(selection_id)
 
         # Selection not found - treat as cancel
-        return MenuResult(cancelled=True, selected=None)
+        return MenuResult(cancelled=found is None, selected=found)
 
 
 class MockLoader:
@@ -84,6 +85,9 @@ class MockLoader:
     def register(self, plugin: Plugin) -> None:
         self._plugins[plugin.info.name] = plugin
 
+    def register_all(self, plugins: Iterable[Plugin]) -> None:
+        self._plugins.update((plugin.info.name, plugin) for plugin in plugins)
+
     def index_all(self) -> None:
         """Mock index_all - does nothing in tests."""
 
@@ -92,15 +96,16 @@ def create_context(
     temp_dir: Path, selections: list[str | None]
 ) -> tuple[PluginContext, MockBackend]:
     """Create a plugin context with a mock backend."""
+    # There's no file at this path, so this is one stat and a default Config;
+    # that's cheaper than deep-copying a shared config for each test
     config = Config.load(temp_dir / "config.toml")
     database = Database(temp_dir / "test.db")
     backend = MockBackend(selections=selections)
-    ctx = PluginContext(config=config, database=database, menu_backend=backend)
+    ctx = PluginContext(config=config, database=database, menu_backend=backend, notifications=[])
 
     # Set up mock loader with bundled plugins
     loader = MockLoader()
-    loader.register(SettingsPlugin())
-    loader.register(PluginsPlugin())
+    loader.register_all([SettingsPlugin(), PluginsPlugin()])
     ctx._loader = loader  # type: ignore[attr-defined]
 
     return ctx, backend
@@ -488,35 +493,27 @@ class TestNavigationPaths:
 class TestMenuItemBehavior:
     """Tests for what happens when each menu item is selected."""
 
-    def test_settings_frequency_shows_notification(
-        self,
-        temp_dir: Path,
-        capsys: pytest.CaptureFixture[str],
-        disable_notify_send: None,
-    ) -> None:
+    def test_settings_frequency_shows_notification(self, temp_dir: Path) -> None:
         """Selecting Frequency Tracking shows appropriate notification."""
         ctx, _ = create_context(temp_dir, ["settings:frequency", "_back"])
         plugin = SettingsPlugin()
 
         plugin.run(ctx)
 
-        captured = capsys.readouterr()
-        assert "frequency" in captured.out.lower()
+        assert ctx.notifications is not None
+        notified = "\n".join(ctx.notifications).lower()
+        assert "frequency" in notified
 
-    def test_settings_backend_selection_shows_notification(
-        self,
-        temp_dir: Path,
-        capsys: pytest.CaptureFixture[str],
-        disable_notify_send: None,
-    ) -> None:
+    def test_settings_backend_selection_shows_notification(self, temp_dir: Path) -> None:
         """Selecting a backend option shows confirmation notification."""
         ctx, _ = create_context(temp_dir, ["settings:backend", "settings:backend:fzf", "_back"])
         plugin = SettingsPlugin()
 
         plugin.run(ctx)
 
-        captured = capsys.readouterr()
-        assert "backend" in captured.out.lower() or "fzf" in captured.out.lower()
+        assert ctx.notifications is not None
+        notified = "\n".join(ctx.notifications).lower()
+        assert "backend" in notified or "fzf" in notified
 
     def test_settings_rebuild_shows_result(self, temp_dir: Path) -> None:
         """Selecting Rebuild Cache shows result screen."""
@@ -534,27 +531,18 @@ class TestMenuItemBehavior:
         messages = [i.title.lower() for i in result_menu.items]
         assert any("cache" in m or "rebuilt" in m for m in messages)
 
-    def test_plugins_updates_shows_notification(
-        self,
-        temp_dir: Path,
-        capsys: pytest.CaptureFixture[str],
-        disable_notify_send: None,
-    ) -> None:
+    def test_plugins_updates_shows_notification(self, temp_dir: Path) -> None:
         """Selecting Check for Updates shows appropriate notification."""
         ctx, _ = create_context(temp_dir, ["plugins:updates", "_back"])
         plugin = PluginsPlugin()
 
         plugin.run(ctx)
 
-        captured = capsys.readouterr()
-        assert "update" in captured.out.lower()
+        assert ctx.notifications is not None
+        notified = "\n".join(ctx.notifications).lower()
+        assert "update" in notified
 
-    def test_plugins_installed_settings_toggle_shows_notification(
-        self,
-        temp_dir: Path,
-        capsys: pytest.CaptureFixture[str],
-        disable_notify_send: None,
-    ) -> None:
+    def test_plugins_installed_settings_toggle_shows_notification(self, temp_dir: Path) -> None:
         """Toggling display mode in plugin options shows notification."""
         ctx, _ = create_context(
             temp_dir,
@@ -571,15 +559,11 @@ class TestMenuItemBehavior:
 
         plugin.run(ctx)
 
-        captured = capsys.readouterr()
-        assert "display mode" in captured.out.lower()
+        assert ctx.notifications is not None
+        notified = "\n".join(ctx.notifications).lower()
+        assert "display mode" in notified
 
-    def test_plugins_installed_plugins_toggle_shows_notification(
-        self,
-        temp_dir: Path,
-        capsys: pytest.CaptureFixture[str],
-        disable_notify_send: None,
-    ) -> None:
+    def test_plugins_installed_plugins_toggle_shows_notification(self, temp_dir: Path) -> None:
         """Toggling display mode in plugin options shows notification."""
         ctx, _ = create_context(
             temp_dir,
@@ -596,15 +580,11 @@ class TestMenuItemBehavior:
 
         plugin.run(ctx)
 
-        captured = capsys.readouterr()
-        assert "display mode" in captured.out.lower()
+        assert ctx.notifications is not None
+        notified = "\n".join(ctx.notifications).lower()
+        assert "display mode" in notified
 
-    def test_plugins_browse_repo_shows_plugins_or_error(
-        self,
-        temp_dir: Path,
-        capsys: pytest.CaptureFixture[str],
-        disable_notify_send: None,
-    ) -> None:
+    def test_plugins_browse_repo_shows_plugins_or_error(self, temp_dir: Path) -> None:
         """Browsing shows plugins menu or error notification."""
         ctx, backend = create_context(
             temp_dir,
@@ -618,11 +598,12 @@ class TestMenuItemBehavior:
 
         plugin.run(ctx)
 
-        captured = capsys.readouterr()
+        assert ctx.notifications is not None
+        notified = "\n".join(ctx.notifications).lower()
         prompts = [c.prompt for c in backend.captures]
         # With one repo, skips to repo plugins directly
         # Either shows error notification (no network) or shows repo menu (network ok)
-        has_error = "failed" in captured.out.lower() or "fetch" in captured.out.lower()
+        has_error = "failed" in notified or "fetch" in notified
         shows_repo_menu = "Official" in prompts
         assert has_error or shows_repo_menu
 
@@ -11,9 +11,10 @@ These tests verify the complete plugin management flow:
 from __future__ import annotations
 
 import contextlib
+import io
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 from unittest.mock import patch
 
 import pytest
@@ -22,11 +23,11 @@ from menu_kit.core.config import Config
 from menu_kit.core.database import Database, ItemType, MenuItem
 from menu_kit.menu.base import MenuBackend, MenuResult
 from menu_kit.plugins.base import MenuCancelled, Plugin, PluginContext
-from menu_kit.plugins.builtin.plugins import PluginsPlugin
+from menu_kit.plugins.builtin.plugins import PluginIndexEntry, PluginsPlugin
 from menu_kit.plugins.builtin.settings import SettingsPlugin
 
 if TYPE_CHECKING:
-    pass
+    from collections.abc import Iterable
 
 
 @dataclass
@@ -70,13 +71,13 @@ class MockBackend(MenuBackend):
         if selection_id is None:
             return MenuResult(cancelled=False, selected=None)
 
-        # Find the item by ID
-        for item in items:
-            if item.id == selection_id:
-                return MenuResult(cancelled=False, selected=item)
+        # Find the item by ID; reversed so the first item with a duplicate
+        # ID wins, as with a linear scan
+        by_id = {item.id: item for item in reversed(items)}
+        found = by_id.get(selection_id)
 
         # Selection not found - treat as cancel
-        return MenuResult(cancelled=True, selected=None)
+        return MenuResult(cancelled=found is None, selected=found)
 
 
 class MockLoader:
@@ -91,27 +92,32 @@ class MockLoader:
     def register(self, plugin: Plugin) -> None:
         self._plugins[plugin.info.name] = plugin
 
+    def register_all(self, plugins: Iterable[Plugin]) -> None:
+        self._plugins.update((plugin.info.name, plugin) for plugin in plugins)
+
 
 def create_context(
     temp_dir: Path, selections: list[str | None]
 ) -> tuple[PluginContext, MockBackend]:
     """Create a plugin context with a mock backend."""
     config = Config.load(temp_dir / "config.toml")
-    database = Database(temp_dir / "test.db")
+    database = Database.in_memory()
     backend = MockBackend(selections=selections)
     ctx = PluginContext(config=config, database=database, menu_backend=backend)
 
     # Set up mock loader with bundled plugins
     loader = MockLoader()
-    loader.register(SettingsPlugin())
-    loader.register(PluginsPlugin())
+    loader.register_all([SettingsPlugin(), PluginsPlugin()])
     ctx._loader = loader  # type: ignore[attr-defined]
 
     return ctx, backend
 
 
+# conftest stubs this out so menus never download indexes; kept for testing it
+_download_repo_index = PluginsPlugin._download_repo_index
+
 # Mock index data for offline tests
-MOCK_INDEX = {
+MOCK_INDEX_DATA: dict[str, Any] = {
     "version": 1,
     "plugins": {
         "test-plugin": {
@@ -129,6 +135,14 @@ MOCK_INDEX = {
     },
 }
 
+# The same index as _fetch_repo_index returns it, with parsed plugin entries
+MOCK_INDEX = {
+    **MOCK_INDEX_DATA,
+    "plugins": {
+        name: PluginIndexEntry.from_dict(info) for name, info in MOCK_INDEX_DATA["plugins"].items()
+    },
+}
+
 
 class TestBrowseMenuStructure:
     """Tests for the Browse Plugins menu structure."""
@@ -157,6 +171,28 @@ class TestBrowseMenuStructure:
         # Should NOT show the full repo path
         assert "markhedleyjones" not in str(prompts)
 
+    def test_browse_menu_lists_repos_without_fetching(self, temp_dir: Path) -> None:
+        """With several repos, the list is built offline and indexes prefetched."""
+        ctx, backend = create_context(temp_dir, ["plugins:browse", "_back", "_back"])
+        repos = ("markhedleyjones/menu-kit-plugins", "other/repo")
+        ctx.config.plugins.repositories = repos
+        plugin = PluginsPlugin()
+
+        with (
+            patch.object(plugin, "_fetch_repo_index") as fetch,
+            patch.object(plugin, "_prefetch_repo_indexes") as prefetch,
+        ):
+            plugin.run(ctx)
+
+        fetch.assert_not_called()
+        prefetch.assert_called_with(repos)
+        repo_menu = next(c for c in backend.captures if c.prompt == "Select Repository")
+        repo_items = [i for i in repo_menu.items if i.id.startswith("plugins:repo:")]
+        assert [(i.title, i.badge) for i in repo_items] == [
+            ("Official", None),
+            ("other/repo", None),
+        ]
+
 
 class TestRepositoryPluginsList:
     """Tests for the repository plugins list (requires network or mock)."""
@@ -212,6 +248,12 @@ class TestRepositoryPluginsList:
             assert item.badge is not None
             assert "v" in item.badge or "." in item.badge  # Version format
 
+    def test_index_entry_from_dict_is_tolerant(self) -> None:
+        """Index entries ignore unknown keys and default missing ones."""
+        entry = PluginIndexEntry.from_dict({"version": 2, "homepage": "https://example.invalid"})
+
+        assert entry == PluginIndexEntry(version="2")
+
 
 class TestPluginInstallScreen:
     """Tests for the plugin install/details screen."""
@@ -277,30 +319,24 @@ class TestPluginInstallFlow:
         self, temp_dir: Path, sandbox_environment: Path
     ) -> None:
         """Installing a plugin creates the plugin directory."""
-        from unittest.mock import MagicMock
-
         plugin = PluginsPlugin()
 
         # Create a mock context
         class MockCtx:
             config = Config.load(temp_dir / "config.toml")
-            database = Database(temp_dir / "test.db")
+            database = Database.in_memory()
 
         # Mock the download to avoid network
         mock_content = b'"""Test plugin."""\n\ndef create_plugin(): pass\n'
 
         with patch("menu_kit.plugins.builtin.plugins.urllib.request.urlopen") as mock_urlopen:
-            mock_response = MagicMock()
-            mock_response.read.return_value = mock_content
-            mock_response.__enter__ = MagicMock(return_value=mock_response)
-            mock_response.__exit__ = MagicMock(return_value=False)
-            mock_urlopen.return_value = mock_response
+            mock_urlopen.return_value = io.BytesIO(mock_content)
 
             result = plugin._install_plugin(
                 MockCtx(),
                 "test/repo",
                 "my-plugin",
-                {"download": "plugins/my-plugin"},
+                PluginIndexEntry(download="plugins/my-plugin"),
             )
 
         assert result is True
@@ -308,12 +344,12 @@ class TestPluginInstallFlow:
         data_dir = sandbox_environment / "data"
         plugin_dir = data_dir / "plugins" / "my-plugin"
         assert plugin_dir.exists()
-        assert (plugin_dir / "__init__.py").exists()
+        assert (plugin_dir / "__init__.py").read_bytes() == mock_content
+        # The temporary download file was renamed into place
+        assert [p.name for p in plugin_dir.iterdir()] == ["__init__.py"]
 
     def test_install_shows_result_screen(self, temp_dir: Path, sandbox_environment: Path) -> None:
         """Installing a plugin shows result screen."""
-        from unittest.mock import MagicMock
-
         ctx, backend = create_context(
             temp_dir,
             [
@@ -333,11 +369,7 @@ class TestPluginInstallFlow:
             patch.object(plugin, "_fetch_repo_index", return_value=MOCK_INDEX),
             patch("menu_kit.plugins.builtin.plugins.urllib.request.urlopen") as mock_urlopen,
         ):
-            mock_response = MagicMock()
-            mock_response.read.return_value = mock_content
-            mock_response.__enter__ = MagicMock(return_value=mock_response)
-            mock_response.__exit__ = MagicMock(return_value=False)
-            mock_urlopen.return_value = mock_response
+            mock_urlopen.return_value = io.BytesIO(mock_content)
 
             with contextlib.suppress(MenuCancelled):
                 plugin.run(ctx)
@@ -349,6 +381,188 @@ class TestPluginInstallFlow:
         messages = [i.title.lower() for i in result_menus[0].items]
         assert any("installed" in m for m in messages)
 
+    def test_install_plugins_batch(self, temp_dir: Path, sandbox_environment: Path) -> None:
+        """Batch install downloads each plugin and reports per-plugin results."""
+        import urllib.error
+
+        plugin = PluginsPlugin()
+        ctx, _ = create_context(temp_dir, [])
+
+        def fake_urlopen(url: str, timeout: float) -> io.BytesIO:
+            if "/broken/" in url:
+                raise urllib.error.URLError("unreachable")
+            return io.BytesIO(f"# {url}\n".encode())
+
+        with patch(
+            "menu_kit.plugins.builtin.plugins.urllib.request.urlopen", side_effect=fake_urlopen
+        ):
+            results = plugin._install_plugins_batch(
+                ctx,
+                "test/repo",
+                [
+                    ("alpha", PluginIndexEntry(download="plugins/alpha")),
+                    ("beta", PluginIndexEntry(download="plugins/beta")),
+                    ("broken", PluginIndexEntry(download="plugins/broken")),
+                ],
+            )
+
+        assert results == {"alpha": True, "beta": True, "broken": False}
+        plugins_dir = sandbox_environment / "data" / "plugins"
+        assert (plugins_dir / "alpha" / "__init__.py").read_text() == (
+            "# https://raw.githubusercontent.com/test/repo/main/plugins/alpha/__init__.py\n"
+        )
+        assert (plugins_dir / "beta" / "__init__.py").exists()
+        assert not (plugins_dir / "broken").exists()
+
+    def test_repo_list_marks_plugin_installed_this_session(self, temp_dir: Path) -> None:
+        """After installing, the repo list shows the plugin as installed."""
+        ctx, backend = create_context(
+            temp_dir,
+            [
+                "plugins:browse",
+                "plugins:available:markhedleyjones/menu-kit-plugins:test-plugin",
+                "plugins:detail:test-plugin:install",
+                "_done",  # Dismiss result screen, back to the repo list
+                "_back",
+                "_back",
+            ],
+        )
+        plugin = PluginsPlugin()
+
+        with (
+            patch.object(plugin, "_fetch_repo_index", return_value=MOCK_INDEX),
+            patch("menu_kit.plugins.builtin.plugins.urllib.request.urlopen") as mock_urlopen,
+            contextlib.suppress(MenuCancelled),
+        ):
+            mock_urlopen.return_value = io.BytesIO(b"def create_plugin(): pass\n")
+            plugin.run(ctx)
+
+        repo_menus = [c for c in backend.captures if c.prompt == "Official"]
+        assert len(repo_menus) == 2
+
+        def badge(capture: MenuCapture) -> str | None:
+            item = next(i for i in capture.items if i.title == "test-plugin")
+            return item.badge
+
+        assert badge(repo_menus[0]) == "v1.0.0"
+        assert badge(repo_menus[1]) == "v1.0.0 (installed)"
+
+    def test_unreadable_plugins_dir_falls_back_to_loaded_plugins(
+        self, temp_dir: Path, sandbox_environment: Path
+    ) -> None:
+        """A plugins path that can't be listed doesn't break the repo list."""
+        (sandbox_environment / "data" / "plugins").write_text("not a directory")
+        ctx, _ = create_context(temp_dir, [])
+        plugin = PluginsPlugin()
+
+        assert plugin._installed_names(ctx) == frozenset({"settings", "plugins"})
+
+    def test_reinstall_same_version_uses_download_cache(
+        self, temp_dir: Path, sandbox_environment: Path
+    ) -> None:
+        """Reinstalling a version that was downloaded before skips the network."""
+        import dataclasses
+        import shutil
+        import urllib.error
+
+        plugin = PluginsPlugin()
+        ctx, _ = create_context(temp_dir, [])
+        info = PluginIndexEntry(version="1.0.0", download="plugins/cached-plugin")
+        mock_content = b"def create_plugin(): pass\n"
+        urlopen = "menu_kit.plugins.builtin.plugins.urllib.request.urlopen"
+
+        with patch(urlopen, return_value=io.BytesIO(mock_content)):
+            assert plugin._install_plugin(ctx, "test/repo", "cached-plugin", info) is True
+
+        plugin_dir = sandbox_environment / "data" / "plugins" / "cached-plugin"
+        shutil.rmtree(plugin_dir)
+
+        with patch(urlopen, side_effect=urllib.error.URLError("offline")) as mock_urlopen:
+            assert plugin._install_plugin(ctx, "test/repo", "cached-plugin", info) is True
+            assert (plugin_dir / "__init__.py").read_bytes() == mock_content
+            assert mock_urlopen.call_count == 0
+
+            # A different version is not in the cache, so it needs the network
+            shutil.rmtree(plugin_dir)
+            newer = dataclasses.replace(info, version="1.1.0")
+            assert plugin._install_plugin(ctx, "test/repo", "cached-plugin", newer) is False
+            assert mock_urlopen.call_count == 1
+
+    def test_bad_cached_download_is_dropped(
+        self, temp_dir: Path, sandbox_environment: Path
+    ) -> None:
+        """A cached download that fails to install is removed and fetched again."""
+        plugin = PluginsPlugin()
+        ctx, _ = create_context(temp_dir, [])
+        info = PluginIndexEntry(version="1.0.0", download="plugins/cached-plugin")
+        cache_path = plugin._download_cache_path("test/repo", "cached-plugin", info)
+        assert cache_path is not None
+        cache_path.parent.mkdir(parents=True)
+        cache_path.write_bytes(b"def create_plugin(:\n")  # Truncated
+        urlopen = "menu_kit.plugins.builtin.plugins.urllib.request.urlopen"
+        mock_content = b"def create_plugin(): pass\n"
+
+        with patch(urlopen, return_value=io.BytesIO(mock_content)) as mock_urlopen:
+            assert plugin._install_plugin(ctx, "test/repo", "cached-plugin", info) is False
+            assert mock_urlopen.call_count == 0
+            assert not cache_path.exists()
+
+            assert plugin._install_plugin(ctx, "test/repo", "cached-plugin", info) is True
+            assert mock_urlopen.call_count == 1
+
+        plugin_dir = sandbox_environment / "data" / "plugins" / "cached-plugin"
+        assert (plugin_dir / "__init__.py").read_bytes() == mock_content
+        assert cache_path.read_bytes() == mock_content
+
+    def test_install_zip_plugin_extracts_package(
+        self, temp_dir: Path, sandbox_environment: Path
+    ) -> None:
+        """A .zip download is fetched once and extracted as the plugin package."""
+        import zipfile
+
+        plugin = PluginsPlugin()
+        ctx, _ = create_context(temp_dir, [])
+
+        def make_zip(files: dict[str, str]) -> io.BytesIO:
+            buffer = io.BytesIO()
+            with zipfile.ZipFile(buffer, "w") as archive:
+                for name, content in files.items():
+                    archive.writestr(name, content)
+            buffer.seek(0)
+            return buffer
+
+        urlopen = "menu_kit.plugins.builtin.plugins.urllib.request.urlopen"
+        package = {"__init__.py": "from .helpers import x\n", "helpers.py": "x = 1\n"}
+        with patch(urlopen, return_value=make_zip(package)) as mock_urlopen:
+            result = plugin._install_plugin(
+                ctx, "test/repo", "zipped", PluginIndexEntry(download="plugins/zipped.zip")
+            )
+
+        assert result is True
+        mock_urlopen.assert_called_once_with(
+            "https://raw.githubusercontent.com/test/repo/main/plugins/zipped.zip", timeout=30
+        )
+        plugin_dir = sandbox_environment / "data" / "plugins" / "zipped"
+        assert sorted(p.name for p in plugin_dir.iterdir()) == ["__init__.py", "helpers.py"]
+        assert (plugin_dir / "helpers.py").read_text() == "x = 1\n"
+
+        # An archive without a top-level __init__.py is rejected and cleaned up
+        with patch(urlopen, return_value=make_zip({"nested/__init__.py": ""})):
+            result = plugin._install_plugin(
+                ctx, "test/repo", "broken", PluginIndexEntry(download="plugins/broken.zip")
+            )
+
+        assert result is False
+        assert not (sandbox_environment / "data" / "plugins" / "broken").exists()
+
+        # A failed download isn't cached, so a retry with a good one succeeds
+        fixed = PluginIndexEntry(version="1.0.0", download="plugins/fixed.zip")
+        with patch(urlopen, return_value=io.BytesIO(b"not a zip")):
+            assert plugin._install_plugin(ctx, "test/repo", "fixed", fixed) is False
+        with patch(urlopen, return_value=make_zip(package)) as mock_urlopen:
+            assert plugin._install_plugin(ctx, "test/repo", "fixed", fixed) is True
+        assert mock_urlopen.call_count == 1
+
 
 class TestInstalledPluginsScreen:
     """Tests for the Installed Plugins screen."""
@@ -463,7 +677,7 @@ class TestPluginUninstallFlow:
         assert test_plugin_dir.exists()
 
         class MockCtx:
-            database = Database(temp_dir / "test.db")
+            database = Database.in_memory()
 
             def unregister_plugin(self, name: str) -> bool:
                 return True
@@ -473,6 +687,15 @@ class TestPluginUninstallFlow:
         assert result is True
         assert not test_plugin_dir.exists()
 
+    def test_uninstall_with_plugins_path_not_a_directory(
+        self, temp_dir: Path, sandbox_environment: Path
+    ) -> None:
+        """Uninstalling fails cleanly when the plugins path is a file."""
+        (sandbox_environment / "data" / "plugins").write_text("not a directory")
+        ctx, _ = create_context(temp_dir, [])
+
+        assert PluginsPlugin()._uninstall_plugin(ctx, "anything") is False
+
     def test_uninstall_removes_symlinked_plugin(
         self, temp_dir: Path, sandbox_environment: Path
     ) -> None:
@@ -493,7 +716,7 @@ class TestPluginUninstallFlow:
         assert symlink.is_symlink()
 
         class MockCtx:
-            database = Database(temp_dir / "test.db")
+            database = Database.in_memory()
 
             def unregister_plugin(self, name: str) -> bool:
                 return True
@@ -663,8 +886,6 @@ class TestFullMenuFlowInstall:
         self, temp_dir: Path, sandbox_environment: Path
     ) -> None:
         """Install a plugin by navigating through all menus."""
-        from unittest.mock import MagicMock
-
         # Verify we're using the sandboxed data dir
         data_dir = sandbox_environment / "data"
         plugins_dir = data_dir / "plugins"
@@ -696,11 +917,7 @@ class TestFullMenuFlowInstall:
             patch.object(plugin, "_fetch_repo_index", return_value=MOCK_INDEX),
             patch("menu_kit.plugins.builtin.plugins.urllib.request.urlopen") as mock_urlopen,
         ):
-            mock_response = MagicMock()
-            mock_response.read.return_value = mock_content
-            mock_response.__enter__ = MagicMock(return_value=mock_response)
-            mock_response.__exit__ = MagicMock(return_value=False)
-            mock_urlopen.return_value = mock_response
+            mock_urlopen.return_value = io.BytesIO(mock_content)
 
             with contextlib.suppress(MenuCancelled):
                 plugin.run(ctx)
@@ -724,8 +941,6 @@ class TestFullMenuFlowInstall:
         self, temp_dir: Path, sandbox_environment: Path
     ) -> None:
         """After installing a plugin, it appears in the installed list."""
-        from unittest.mock import MagicMock
-
         from menu_kit.plugins.base import PluginInfo
 
         # Create a fake plugin that simulates being installed
@@ -783,11 +998,7 @@ class TestFullMenuFlowInstall:
         def simulate_install(*args, **kwargs):
             # Simulate the plugin being installed by registering it
             loader.register(FakeInstalledPlugin())  # type: ignore[arg-type]
-            mock_response = MagicMock()
-            mock_response.read.return_value = mock_content
-            mock_response.__enter__ = MagicMock(return_value=mock_response)
-            mock_response.__exit__ = MagicMock(return_value=False)
-            return mock_response
+            return io.BytesIO(mock_content)
 
         with (
             patch.object(plugin, "_fetch_repo_index", return_value=MOCK_INDEX),
@@ -809,6 +1020,107 @@ class TestFullMenuFlowInstall:
         assert "plugins:info:test-plugin" in plugin_ids
 
 
+class TestRepoIndexCache:
+    """Tests for the on-disk repository index cache."""
+
+    def test_second_fetch_is_conditional(self) -> None:
+        """A cached index is revalidated and reused on a 304."""
+        import json
+        import urllib.error
+        from email.message import Message
+        from unittest.mock import MagicMock
+
+        plugin = PluginsPlugin()
+
+        response = MagicMock()
+        response.read.return_value = json.dumps(MOCK_INDEX_DATA).encode()
+        response.headers = {"ETag": '"abc123"', "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"}
+        response.__enter__ = MagicMock(return_value=response)
+        response.__exit__ = MagicMock(return_value=False)
+        not_modified = urllib.error.HTTPError(
+            "https://example.invalid", 304, "Not Modified", Message(), None
+        )
+
+        with patch(
+            "menu_kit.plugins.builtin.plugins.urllib.request.urlopen",
+            side_effect=[response, not_modified],
+        ) as mock_urlopen:
+            first = _download_repo_index(plugin, "test/repo")
+            second = _download_repo_index(plugin, "test/repo")
+
+        assert first == MOCK_INDEX
+        assert second == MOCK_INDEX
+
+        first_request = mock_urlopen.call_args_list[0].args[0]
+        second_request = mock_urlopen.call_args_list[1].args[0]
+        assert first_request.get_header("If-none-match") is None
+        assert second_request.get_header("If-none-match") == '"abc123"'
+        assert second_request.get_header("If-modified-since") == "Wed, 01 Jan 2025 00:00:00 GMT"
+
+    def test_fetch_reuses_recent_index(self) -> None:
+        """Repeated fetches within the TTL don't hit the network again."""
+        plugin = PluginsPlugin()
+
+        with patch.object(plugin, "_download_repo_index", return_value=MOCK_INDEX) as download:
+            assert plugin._fetch_repo_index("test/repo") == MOCK_INDEX
+            assert plugin._fetch_repo_index("test/repo") == MOCK_INDEX
+            assert download.call_count == 1
+
+            # Once stale, the index is fetched again
+            plugin._index_cache["test/repo"] = (0.0, MOCK_INDEX)
+            with patch("menu_kit.plugins.builtin.plugins.time.monotonic", return_value=1e9):
+                plugin._fetch_repo_index("test/repo")
+            assert download.call_count == 2
+
+    def test_index_write_removes_stale_temp_files(self, sandbox_environment: Path) -> None:
+        """Temp files left by interrupted writes are cleaned up on the next write."""
+        import os
+
+        plugin = PluginsPlugin()
+        body_path, meta_path = plugin._index_cache_paths("test/repo")
+        body_path.parent.mkdir(parents=True)
+        stale = body_path.parent / ".test__repo.json.abc123.tmp"
+        fresh = body_path.parent / ".other__repo.json.def456.tmp"
+        stale.write_bytes(b"partial")
+        fresh.write_bytes(b"in progress")
+        os.utime(stale, (0, 0))
+
+        plugin._write_index_cache(body_path, meta_path, b"{}", {"etag": None})
+
+        assert body_path.read_bytes() == b"{}"
+        assert not stale.exists()
+        assert fresh.exists()
+
+    def test_main_menu_prefetches_index_for_browse(self, temp_dir: Path) -> None:
+        """Opening the main menu fetches the index once, and browsing reuses it."""
+        ctx, backend = create_context(temp_dir, ["plugins:browse", "_back", "_back"])
+        plugin = PluginsPlugin()
+
+        with (
+            patch.object(plugin, "_download_repo_index", return_value=MOCK_INDEX) as download,
+        ):
+            plugin.run(ctx)
+
+        assert download.call_count == 1
+        download.assert_called_once_with(PluginsPlugin.OFFICIAL_REPO)
+        repo_menu = backend.captures[1]
+        assert repo_menu.prompt == "Official"
+        assert any(i.id.endswith(":test-plugin") for i in repo_menu.items)
+
+    def test_failed_prefetch_falls_back_to_direct_fetch(self) -> None:
+        """A prefetch that found nothing doesn't stop browsing from retrying."""
+        plugin = PluginsPlugin()
+
+        with patch.object(
+            plugin, "_download_repo_index", side_effect=[None, MOCK_INDEX]
+        ) as download:
+            plugin._prefetch_repo_indexes(["test/repo"])
+            assert plugin._fetch_repo_index("test/repo") == MOCK_INDEX
+
+        assert download.call_count == 2
+        assert not plugin._prefetches
+
+
 class TestRealNetworkIntegration:
     """Integration tests that use real network (marked for optional skip)."""
 
@@ -832,9 +1144,10 @@ class TestRealNetworkIntegration:
         assert index is not None
 
         for _name, info in index["plugins"].items():
-            assert "version" in info
-            assert "description" in info
-            assert "download" in info
+            assert isinstance(info, PluginIndexEntry)
+            assert info.version
+            assert info.description
+            assert info.download
 
     @pytest.mark.network
     def test_can_install_real_plugin(self, sandbox_environment: Path) -> None:
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from pathlib import Path
 from unittest.mock import MagicMock
 
 import pytest
@@ -9,7 +10,10 @@ import pytest
 from menu_kit.core.config import Config
 from menu_kit.core.database import Database, ItemType, MenuItem
 from menu_kit.menu.base import MenuResult
-from menu_kit.plugins.base import MenuCancelled, PluginContext
+from menu_kit.plugins.base import MenuCancelled, Plugin, PluginContext
+from menu_kit.plugins.builtin.plugins import PluginsPlugin
+from menu_kit.plugins.builtin.settings import SettingsPlugin
+from menu_kit.plugins.loader import PluginLoader
 
 
 def test_plugin_context_menu_with_back_button(config: Config, database: Database) -> None:
@@ -103,3 +107,94 @@ def test_plugin_context_menu_cancelled_raises_exception(config: Config, database
 
     with pytest.raises(MenuCancelled):
         ctx.menu(items, prompt="Test", show_back=True)
+
+
+def test_loader_later_plugin_dirs_override_earlier(
+    config: Config, database: Database, sandbox_environment: Path
+) -> None:
+    """Test that a ~/.config plugin overrides a ~/.local/share one of the same name."""
+
+    def write_plugin(plugins_dir: Path, version: str) -> None:
+        plugins_dir.mkdir()
+        (plugins_dir / "dup.py").write_text(
+            "from menu_kit.plugins.base import Plugin, PluginInfo\n"
+            "\n"
+            "class Dup(Plugin):\n"
+            "    @property\n"
+            "    def info(self):\n"
+            f'        return PluginInfo(name="dup", version="{version}")\n'
+            "\n"
+            "    def run(self, ctx, action=''):\n"
+            "        pass\n"
+            "\n"
+            "def create_plugin():\n"
+            "    return Dup()\n"
+        )
+
+    write_plugin(sandbox_environment / "data" / "plugins", "1.0.0")
+    write_plugin(sandbox_environment / "config" / "plugins", "2.0.0")
+
+    loader = PluginLoader(config, database, MagicMock())
+    plugins = loader.load_all()
+
+    assert plugins["dup"].info.version == "2.0.0"
+
+
+def test_loader_plugins_view_is_read_only_and_live(config: Config, database: Database) -> None:
+    """Test that get_all_plugins returns a read-only view that tracks registrations."""
+    loader = PluginLoader(config, database, MagicMock())
+    plugins = loader.get_all_plugins()
+
+    with pytest.raises(TypeError):
+        plugins["settings"] = SettingsPlugin()  # type: ignore[index]
+
+    loader.register_all([SettingsPlugin()])
+    assert "settings" in plugins
+    assert loader.get_all_plugins() is plugins
+
+
+def test_installed_plugins_cached_until_invalidated(config: Config, database: Database) -> None:
+    """Test that installed plugins are cached and refreshed after invalidation."""
+    ctx = PluginContext(config=config, database=database, menu_backend=MagicMock())
+    plugins: dict[str, Plugin] = {"settings": SettingsPlugin()}
+    loader = MagicMock()
+    loader.get_all_plugins.return_value = plugins
+    ctx._loader = loader  # type: ignore[attr-defined]
+
+    assert list(ctx.get_installed_plugins()) == ["settings"]
+
+    plugins["plugins"] = PluginsPlugin()
+    assert list(ctx.get_installed_plugins()) == ["settings"]
+    assert loader.get_all_plugins.call_count == 1
+
+    # The cached mapping is shared, so callers can't change it
+    with pytest.raises(TypeError):
+        ctx.get_installed_plugins()["plugins"] = PluginsPlugin().info  # type: ignore[index]
+
+    ctx.invalidate_plugins()
+    assert list(ctx.get_installed_plugins()) == ["plugins", "settings"]
+
+
+def test_notify_records_to_context_notifications(config: Config, database: Database) -> None:
+    """Test that notify() appends to the context's notifications list when set."""
+    ctx = PluginContext(
+        config=config, database=database, menu_backend=MagicMock(), notifications=[]
+    )
+
+    ctx.notify("Installed")
+
+    assert ctx.notifications == ["Installed"]
+
+
+def test_notify_falls_back_to_stdout(
+    config: Config,
+    database: Database,
+    capsys: pytest.CaptureFixture[str],
+    disable_notify_send: None,
+) -> None:
+    """Test that notify() writes to stdout without notify-send or a notifications list."""
+    ctx = PluginContext(config=config, database=database, menu_backend=MagicMock())
+
+    ctx.notify("Installed", title="Plugins")
+
+    assert capsys.readouterr().out == "[Plugins] Installed\n"